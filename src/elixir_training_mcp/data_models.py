@@ -1,19 +1,40 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import date, datetime, time, timezone
-from typing import Iterable, Optional
+from functools import lru_cache
+from operator import attrgetter
+from typing import Iterable, Optional, TypeVar
 
 from rdflib.term import Literal
 
+T = TypeVar("T")
 
-@dataclass(frozen=True)
+
+def _pickle_as_arguments(cls: type[T]) -> type[T]:
+    """Pickle instances as their constructor arguments.
+
+    Slotted frozen dataclasses otherwise restore each field through a generic
+    ``__setstate__`` loop, which makes loading large snapshots slower.
+    """
+    values = attrgetter(*(item.name for item in fields(cls)))  # type: ignore[arg-type]
+
+    def reduce(self: T) -> tuple[type[T], tuple[object, ...]]:
+        return type(self), values(self)
+
+    cls.__reduce__ = reduce  # type: ignore[method-assign, assignment]
+    return cls
+
+
+@_pickle_as_arguments
+@dataclass(frozen=True, slots=True)
 class Organization:
     name: str
     url: str | None = None
 
 
-@dataclass(frozen=True)
+@_pickle_as_arguments
+@dataclass(frozen=True, slots=True)
 class CourseInstance:
     start_date: datetime | None = None
     start_raw: str | None = None
@@ -31,8 +52,12 @@ class CourseInstance:
     organizers: tuple[Organization, ...] = field(default_factory=tuple)
 
 
-@dataclass(frozen=True)
+@_pickle_as_arguments
+@dataclass(frozen=True, slots=True)
 class TrainingResource:
+    # Collection fields stay tuples and frozensets so resources remain hashable
+    # and immutable once shared through the indexes; builders freeze their
+    # short working lists once, here at construction.
     uri: str
     source: str
     types: frozenset[str] = field(default_factory=frozenset)
@@ -69,6 +94,8 @@ class TrainingResource:
     date_modified: datetime | None = None
     date_modified_raw: str | None = None
     course_instances: tuple[CourseInstance, ...] = field(default_factory=tuple)
+    # Search tokens derived from the text fields, filled in once at parse time.
+    keyword_tokens: frozenset[str] = field(default_factory=frozenset, compare=False, repr=False)
 
 
 def literal_to_str(value: Optional[Literal]) -> str | None:
@@ -142,6 +169,8 @@ def literal_to_datetime(value: Optional[Literal]) -> tuple[datetime | None, str
     return None, raw
 
 
+# Harvests repeat the same date strings across resources; datetimes are immutable.
+@lru_cache(maxsize=1 << 16)
 def _parse_datetime_string(raw: str) -> datetime | None:
     formats = [
         "%Y-%m-%d %H:%M:%S %z",
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from types import MappingProxyType
-from typing import Any, Mapping
+from typing import Any, Iterator, Mapping
 
-from collections import defaultdict
+from collections import Counter
 
 from rdflib import Dataset
 
@@ -23,13 +25,19 @@ from .data_models import (
 from .indexes import (
     CourseSchedule,
     DateIndex,
+    DateIndexBuilder,
     KeywordIndex,
+    KeywordIndexBuilder,
     LocationIndex,
+    LocationIndexBuilder,
     ProviderIndex,
+    ProviderIndexBuilder,
     TopicIndex,
+    TopicIndexBuilder,
 )
-from .loader import extract_resources_from_graph, load_dataset
+from .loader import extract_resources_from_file, load_dataset, load_sparql_store, source_graph_uri
 from .loader.dedupe import select_richest
+from .loader.snapshot import read_snapshot, snapshot_path, write_snapshot
 
 # Re-export selected data model helpers for compatibility.
 CourseInstance = _CourseInstance
@@ -40,10 +48,30 @@ literal_to_int = _literal_to_int
 literal_to_str = _literal_to_str
 literals_to_strings = _literals_to_strings
 
+# Marks a SPARQL store that could not be loaded (no pyoxigraph, or a file it rejects).
+_NO_SPARQL_STORE = object()
+
+
+class _KeywordTokensView(Mapping[str, frozenset[str]]):
+    """Read-only URI -> keyword tokens mapping backed by the resources themselves."""
+
+    __slots__ = ("_resources",)
+
+    def __init__(self, resources: Mapping[str, TrainingResource]) -> None:
+        self._resources = resources
+
+    def __getitem__(self, uri: str) -> frozenset[str]:
+        return self._resources[uri].keyword_tokens
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._resources)
+
+    def __len__(self) -> int:
+        return len(self._resources)
+
 
 @dataclass(frozen=True)
 class TrainingDataStore:
-    dataset: Dataset
     resources_by_uri: Mapping[str, TrainingResource]
     per_source_counts: Mapping[str, int]
     load_timestamp: datetime
@@ -54,70 +82,163 @@ class TrainingDataStore:
     date_index: DateIndex
     topic_index: TopicIndex
     stats: Mapping[str, Any]
+    source_paths: Mapping[str, Path] = field(default_factory=dict)
+    _dataset: Dataset | None = field(default=None, repr=False, compare=False)
+    _sparql_store: Any = field(default=None, repr=False, compare=False)
 
     @property
     def resource_count(self) -> int:
         return len(self.resources_by_uri)
 
+    @property
+    def tokens_by_uri(self) -> Mapping[str, frozenset[str]]:
+        """Each resource's keyword tokens keyed by URI, read through ``resources_by_uri``."""
+        return _KeywordTokensView(self.resources_by_uri)
 
-def load_training_data(source_paths: Mapping[str, Path]) -> TrainingDataStore:
-    dataset, graphs_by_source, source_graphs = load_dataset(source_paths)
-    resource_map: dict[str, TrainingResource] = {}
-    per_source_counts: dict[str, int] = {}
+    @property
+    def dataset(self) -> Dataset:
+        """The RDF dataset of every source, parsed on first access."""
+        dataset = self._dataset
+        if dataset is None:
+            dataset, _, _ = load_dataset(self.source_paths)
+            object.__setattr__(self, "_dataset", dataset)
+        return dataset
 
-    for source_key, graph in graphs_by_source.items():
-        resources = extract_resources_from_graph(graph, source_key)
-        per_source_counts[source_key] = len(resources)
-        for resource in resources.values():
-            select_richest(resource_map, resource)
+    @property
+    def sparql_store(self) -> Any | None:
+        """A pyoxigraph store of every source, loaded on first access; None without pyoxigraph."""
+        store = self._sparql_store
+        if store is None:
+            # Remember a failed load so it is not retried on every query.
+            store = load_sparql_store(self.source_paths)
+            object.__setattr__(self, "_sparql_store", _NO_SPARQL_STORE if store is None else store)
+        return None if store is _NO_SPARQL_STORE else store
+
+    def release_dataset(self) -> None:
+        """Drop the parsed RDF dataset and SPARQL store so they can be collected; both re-parse on demand."""
+        object.__setattr__(self, "_dataset", None)
+        object.__setattr__(self, "_sparql_store", None)
+
+
+def load_training_data(
+    source_paths: Mapping[str, Path],
+    cache_dir: Path | None = None,
+    max_workers: int | None = None,
+) -> TrainingDataStore:
+    """
+    Load, deduplicate and index the harvested training resources.
 
-    timestamp = datetime.now(timezone.utc)
-    keyword_index, provider_index, location_index, date_index, topic_index = _build_indexes(resource_map)
-    stats = _build_stats(resource_map, per_source_counts, timestamp)
+    When ``cache_dir`` is given, the extracted resources and built indexes are
+    snapshotted there and reused on later calls as long as the source files are
+    unchanged.
+
+    With several sources and more than one worker (``max_workers`` defaults to
+    the CPU count), each source is parsed and extracted in its own process;
+    results are merged in source order. Extraction never builds the RDF
+    dataset; ``dataset`` parses it on first access.
+    """
+    snapshot = snapshot_path(cache_dir, source_paths) if cache_dir is not None else None
+    cached = read_snapshot(snapshot) if snapshot is not None else None
+
+    if isinstance(cached, tuple) and len(cached) == 4:
+        resource_map, per_source_counts, indexes, stats = cached
+        timestamp = datetime.now(timezone.utc)
+        stats = {**stats, "loaded_at": timestamp.isoformat()}
+    else:
+        workers = min(len(source_paths), max_workers or os.cpu_count() or 1)
+        if workers > 1:
+            extracted = _extract_in_processes(source_paths, workers)
+        else:
+            extracted = {
+                source_key: extract_resources_from_file(source_key, file_path)
+                for source_key, file_path in source_paths.items()
+            }
+        resource_map, per_source_counts = _merge_resources(extracted)
+        timestamp = datetime.now(timezone.utc)
+        indexes, stats = _build_indexes_and_stats(resource_map, per_source_counts, timestamp)
+        if snapshot is not None:
+            write_snapshot(snapshot, (resource_map, per_source_counts, indexes, stats))
+
+    keyword_index, provider_index, location_index, date_index, topic_index = indexes
 
     return TrainingDataStore(
-        dataset=dataset,
         resources_by_uri=MappingProxyType(resource_map),
         per_source_counts=MappingProxyType(per_source_counts),
         load_timestamp=timestamp,
-        source_graphs=MappingProxyType(source_graphs),
+        source_graphs=MappingProxyType({key: str(source_graph_uri(key)) for key in source_paths}),
         keyword_index=keyword_index,
         provider_index=provider_index,
         location_index=location_index,
         date_index=date_index,
         topic_index=topic_index,
         stats=MappingProxyType(stats),
+        source_paths=MappingProxyType(dict(source_paths)),
     )
 
 
-def _build_indexes(
-    resources: Mapping[str, TrainingResource],
-) -> tuple[KeywordIndex, ProviderIndex, LocationIndex, DateIndex, TopicIndex]:
-    keyword_index = KeywordIndex.from_resources(resources)
-    provider_index = ProviderIndex.from_resources(resources)
-    location_index = LocationIndex.from_resources(resources)
-    date_index = DateIndex.from_resources(resources)
-    topic_index = TopicIndex.from_resources(resources)
-    return keyword_index, provider_index, location_index, date_index, topic_index
+def _extract_in_processes(source_paths: Mapping[str, Path], workers: int) -> dict[str, dict[str, TrainingResource]]:
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Submit the largest files first so the longest parse never starts last.
+        futures = {
+            source_key: executor.submit(extract_resources_from_file, source_key, source_paths[source_key])
+            for source_key in sorted(source_paths, key=lambda key: _file_size(source_paths[key]), reverse=True)
+        }
+        return {source_key: futures[source_key].result() for source_key in source_paths}
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def _merge_resources(
+    extracted: Mapping[str, Mapping[str, TrainingResource]],
+) -> tuple[dict[str, TrainingResource], dict[str, int]]:
+    resource_map: dict[str, TrainingResource] = {}
+    per_source_counts: dict[str, int] = {}
+
+    for source_key, resources in extracted.items():
+        per_source_counts[source_key] = len(resources)
+        for resource in resources.values():
+            select_richest(resource_map, resource)
 
+    return resource_map, per_source_counts
 
-def _build_stats(
+
+def _build_indexes_and_stats(
     resources: Mapping[str, TrainingResource],
     per_source_counts: Mapping[str, int],
     timestamp: datetime,
-) -> dict[str, Any]:
-    type_distribution: defaultdict[str, int] = defaultdict(int)
-    access_mode_distribution: defaultdict[str, int] = defaultdict(int)
-    audience_role_distribution: defaultdict[str, int] = defaultdict(int)
+) -> tuple[
+    tuple[KeywordIndex, ProviderIndex, LocationIndex, DateIndex, TopicIndex],
+    dict[str, Any],
+]:
+    """Build every index and the stats payload in one pass."""
+    keyword_builder = KeywordIndexBuilder()
+    provider_builder = ProviderIndexBuilder()
+    location_builder = LocationIndexBuilder()
+    date_builder = DateIndexBuilder()
+    topic_builder = TopicIndexBuilder()
+
+    type_distribution: Counter[str] = Counter()
+    access_mode_distribution: Counter[str] = Counter()
+    audience_role_distribution: Counter[str] = Counter()
     topic_example: dict[str, str] = {}
 
     for uri, resource in resources.items():
-        for resource_type in resource.types:
-            type_distribution[resource_type] += 1
-        for access_mode in resource.access_modes:
-            access_mode_distribution[access_mode] += 1
-        for role in resource.audience_roles:
-            audience_role_distribution[role] += 1
+        keyword_builder.add(uri, resource)
+        provider_builder.add(uri, resource)
+        topic_builder.add(uri, resource)
+        # Feed the schedule and place builders flat rows from a single walk.
+        for instance in resource.course_instances:
+            date_builder.add_schedule(uri, instance.start_date, instance.end_date)
+            location_builder.add_place(uri, instance.country, instance.locality)
+
+        type_distribution.update(resource.types)
+        access_mode_distribution.update(resource.access_modes)
+        audience_role_distribution.update(resource.audience_roles)
         if resource.topics:
             topic_example.setdefault(next(iter(resource.topics)), uri)
 
@@ -131,4 +252,11 @@ def _build_stats(
         "sample_topic_examples": topic_example,
     }
 
-    return stats
+    indexes = (
+        keyword_builder.build(),
+        provider_builder.build(),
+        location_builder.build(),
+        date_builder.build(),
+        topic_builder.build(),
+    )
+    return indexes, stats
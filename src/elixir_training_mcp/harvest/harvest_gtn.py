@@ -7,7 +7,8 @@ Features:
 - Sitemap discovery and parsing (handles nested sitemap indexes)
 - Robots.txt respect with configurable user agent
 - Rate limiting and politeness delays
-- Concurrent fetching with semaphore control
+- Concurrent fetching with a bounded worker pool that backs off on 429/503
+- robots.txt and the sitemap URL list cached on disk between runs (one hour)
 - JSON-LD extraction via extruct
 - Automatic filtering to LearningResource objects
 
@@ -15,27 +16,40 @@ Flow:
 - Fetch sitemap (and nested sitemaps if any)
 - Collect page URLs (filter tutorials/slides)
 - Respect robots.txt (disallow) and rate-limit
-- Fetch HTML and extract JSON-LD via extruct
+- Stream HTML and extract JSON-LD via extruct, stopping after <head> when it has some
 - Save one .jsonld file per page for later KG building
 """
 
 import argparse
 import asyncio
+import contextlib
 import json
-from collections.abc import Iterable
+import os
+import time
+import xml.etree.ElementTree as ET
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 from urllib.parse import urlparse
 from urllib.robotparser import RobotFileParser
 
 import extruct
 import httpx
+from lxml import etree
 from pyld import jsonld
-from rdflib import Graph
+from rdflib import BNode, Graph, Literal, URIRef
+from rdflib.term import Node
 
 DEFAULT_BASE_URL = "https://training.galaxyproject.org"
+JSONLD_SCRIPT_TYPE = "application/ld+json"
+HTML_CONTENT_TYPES = frozenset({"text/html", "application/xhtml+xml"})
+# Responses that mean "slow down" rather than "this page is broken".
+OVERLOAD_STATUS_CODES = frozenset({429, 503})
+ROBOTS_MAX_BYTES = 500 * 1024
+_TRAINING_PAGE_SUFFIXES = ("/tutorial.html", "/slides.html")
 
 
 @dataclass
@@ -47,32 +61,80 @@ class ScrapeConfig:
     timeout_s: int = 30
     max_concurrency: int = 5
     request_delay_s: float = 0.5
+    max_attempts: int = 3
+    max_page_bytes: int = 2 * 1024 * 1024
     respect_robots: bool = True
     filter_learning_resource_only: bool = True
+    # robots.txt and the sitemap URL list are reused from here for cache_ttl_s; None disables it.
+    cache_dir: Path | None = Path(".cache/gtn")
+    cache_ttl_s: float = 3600
 
 
 class GTNSitemapScraper:
+    """Scrape GTN pages listed in the sitemap.
+
+    robots.txt, sitemap and page requests share one HTTP client so connections to
+    the host are reused. Use the scraper as an async context manager, or call
+    ``aclose()`` when done, to release the client.
+    """
+
     def __init__(self, config: ScrapeConfig) -> None:
         self.cfg = config
         self.cfg.out_dir.mkdir(parents=True, exist_ok=True)
-        self._sem = asyncio.Semaphore(self.cfg.max_concurrency)
         self._robots: RobotFileParser | None = None
+        self._client: httpx.AsyncClient | None = None
+
+    async def __aenter__(self) -> "GTNSitemapScraper":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client; a later request opens a new one."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _http_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.cfg.timeout_s,
+                headers={"User-Agent": self.cfg.user_agent},
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=self.cfg.max_concurrency),
+            )
+        return self._client
 
     async def _ensure_robots(self) -> None:
         """Fetch and parse robots.txt if respect_robots is enabled.
 
-        Attempts to download and parse the site's robots.txt file. Falls back to
-        allowing all access if robots.txt cannot be fetched.
+        Attempts to download and parse the site's robots.txt file, reading at most
+        ``ROBOTS_MAX_BYTES``. A fresh cached copy is used instead of downloading.
+        Falls back to allowing all access if robots.txt cannot be fetched.
         """
         if not self.cfg.respect_robots or self._robots is not None:
             return
-        robots_url = f"{self.cfg.base_url.rstrip('/')}/robots.txt"
         rp = RobotFileParser()
+        cached = self._read_cache("robots.txt")
+        if cached is not None:
+            rp.parse(cached.splitlines())
+            self._robots = rp
+            return
+        robots_url = f"{self.cfg.base_url.rstrip('/')}/robots.txt"
         try:
-            async with httpx.AsyncClient(timeout=self.cfg.timeout_s) as client:
-                resp = await client.get(robots_url)
+            # Read at most ROBOTS_MAX_BYTES, as Google does; later rules are ignored.
+            body = bytearray()
+            async with self._http_client().stream("GET", robots_url) as resp:
                 resp.raise_for_status()
-                rp.parse(resp.text.splitlines())
+                async for chunk in resp.aiter_bytes():
+                    body += chunk
+                    if len(body) >= ROBOTS_MAX_BYTES:
+                        break
+            text = body[:ROBOTS_MAX_BYTES].decode("utf-8", errors="replace")
+            rp.parse(text.splitlines())
+            self._write_cache("robots.txt", text)
         except (httpx.HTTPError, httpx.TimeoutException):
             # If robots cannot be fetched, default to allowing
             rp.parse(["User-agent: *", "Allow: /"])
@@ -92,112 +154,165 @@ class GTNSitemapScraper:
         return self._robots.can_fetch(self.cfg.user_agent, url)
 
     async def fetch_sitemap_urls(self) -> list[str]:
-        """Fetch URLs from sitemap or sitemap index (depth 1)."""
+        """Fetch URLs from sitemap or sitemap index (depth 1).
+
+        A fresh cached list from a run with the same sitemap paths is returned as is.
+        """
+        cached = self._read_cache("sitemap_urls.json")
+        if cached is not None:
+            try:
+                payload = json.loads(cached)
+                if payload["sitemap_paths"] == list(self.cfg.sitemap_paths):
+                    return list(payload["urls"])
+            except (ValueError, KeyError, TypeError):
+                pass
         urls: list[str] = []
-        async with httpx.AsyncClient(timeout=self.cfg.timeout_s) as client:
-            # Try each sitemap path
-            for rel in self.cfg.sitemap_paths:
-                sitemap_url = f"{self.cfg.base_url.rstrip('/')}{rel}"
+        seen: set[str] = set()
+
+        def keep(locs: list[str]) -> None:
+            # Filter and deduplicate in one pass as each sitemap is read, preserving order
+            for u in locs:
+                if u not in seen and _is_training_page(u):
+                    seen.add(u)
+                    urls.append(u)
+
+        client = self._http_client()
+        # Try each sitemap path
+        for rel in self.cfg.sitemap_paths:
+            sitemap_url = f"{self.cfg.base_url.rstrip('/')}{rel}"
+            try:
+                is_index, locs = await _stream_sitemap_locs(client, sitemap_url)
+            except (httpx.HTTPError, httpx.TimeoutException):
+                continue
+            if not is_index:
+                keep(locs)
+                continue
+            # collect nested sitemap <loc>
+            for sm in locs:
                 try:
-                    r = await client.get(sitemap_url)
-                    if r.status_code != 200:
-                        continue
-                    # Very simple XML parsing without extra deps
-                    text = r.text
-                    if "<sitemapindex" in text:
-                        # collect nested sitemap <loc>
-                        nested = _extract_xml_tags(text, "loc")
-                        for sm in nested:
-                            try:
-                                rs = await client.get(sm)
-                                rs.raise_for_status()
-                                urls.extend(_extract_xml_tags(rs.text, "loc"))
-                            except (httpx.HTTPError, httpx.TimeoutException):
-                                continue
-                    else:
-                        urls.extend(_extract_xml_tags(text, "loc"))
+                    _, nested_locs = await _stream_sitemap_locs(client, sm)
                 except (httpx.HTTPError, httpx.TimeoutException):
                     continue
+                keep(nested_locs)
+        if urls:
+            payload = {"sitemap_paths": list(self.cfg.sitemap_paths), "urls": urls}
+            self._write_cache("sitemap_urls.json", json.dumps(payload))
+        return urls
+
+    def _cache_path(self, name: str) -> Path | None:
+        if self.cfg.cache_dir is None:
+            return None
+        host = urlparse(self.cfg.base_url).netloc or "default"
+        return self.cfg.cache_dir / f"{host}_{name}"
 
-        # Filter to GTN training pages likely to contain JSON-LD
-        # Target tutorial.html and slides.html pages (not FAQs, workflows, experiences)
-        urls = [
-            u
-            for u in urls
-            if "/training-material/topics/" in u
-            and "/tutorials/" in u
-            and (
-                u.endswith("/tutorial.html")
-                or u.endswith("/slides.html")
-                or "/slides-plain.html" in u
-            )
-            and "/faqs/" not in u
-            and "/workflows/" not in u
-            and "/experiences/" not in u
-        ]
+    def _read_cache(self, name: str) -> str | None:
+        """Return a cached file's text if it was written less than ``cache_ttl_s`` ago."""
+        path = self._cache_path(name)
+        if path is None:
+            return None
+        try:
+            if time.time() - path.stat().st_mtime > self.cfg.cache_ttl_s:
+                return None
+            return path.read_text(encoding="utf-8")
+        except OSError:
+            return None
 
-        # Deduplicate while preserving order
-        seen: set[str] = set()
-        deduped: list[str] = []
-        for u in urls:
-            if u not in seen:
-                seen.add(u)
-                deduped.append(u)
-        return deduped
+    def _write_cache(self, name: str, text: str) -> None:
+        # The cache only saves requests, so a failed write is ignored.
+        path = self._cache_path(name)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(text, encoding="utf-8")
+        except OSError:
+            pass
 
     async def scrape_all(self, max_urls: int | None = None) -> list[Path]:
+        """Scrape every sitemap page and return the written files in sitemap order."""
+        results = [item async for item in self._scrape_stream(max_urls)]
+        return [path for _, path in sorted(results, key=lambda item: item[0])]
+
+    async def iter_scrape(self, max_urls: int | None = None) -> AsyncIterator[Path]:
+        """Yield each written file as soon as its page is done, in completion order.
+
+        Stopping the iteration early cancels the remaining requests.
+        """
+        async for _, path in self._scrape_stream(max_urls):
+            yield path
+
+    async def _scrape_stream(self, max_urls: int | None) -> AsyncIterator[tuple[int, Path]]:
         await self._ensure_robots()
         all_urls = await self.fetch_sitemap_urls()
         if max_urls is not None:
             all_urls = all_urls[:max_urls]
 
-        out_files: list[Path] = []
-        async with httpx.AsyncClient(
-            timeout=self.cfg.timeout_s,
-            headers={"User-Agent": self.cfg.user_agent},
-            follow_redirects=True,
-        ) as client:
-            tasks = [self._scrape_one(client, url) for url in all_urls]
-            for coro_chunk in _chunked(tasks, self.cfg.max_concurrency):
-                results = await asyncio.gather(*coro_chunk, return_exceptions=True)
-                # brief politeness delay between chunks
-                await asyncio.sleep(self.cfg.request_delay_s)
-                for res in results:
-                    if isinstance(res, Path):
-                        out_files.append(res)
-        return out_files
+        client = self._http_client()
+        limiter = _AdaptiveLimiter(self.cfg.max_concurrency)
+        queue: asyncio.Queue[tuple[int, str, int]] = asyncio.Queue()
+        for position, url in enumerate(all_urls):
+            queue.put_nowait((position, url, 1))
+        # Written files by sitemap position; None marks that every worker has finished.
+        done: asyncio.Queue[tuple[int, Path] | None] = asyncio.Queue()
+        # Bounds pages that trickle in slowly enough to pass httpx's per-read timeout.
+        page_timeout_s = self.cfg.timeout_s * 2
+
+        async def worker() -> None:
+            # Each worker takes the next URL as soon as it is free, so one slow page
+            # never holds up the others. The limiter caps how many are in flight.
+            while not queue.empty():
+                position, url, attempt = queue.get_nowait()
+                delay = self.cfg.request_delay_s
+                async with limiter:
+                    try:
+                        path = await asyncio.wait_for(self._scrape_one(client, url), page_timeout_s)
+                        limiter.record_success()
+                        if path is not None:
+                            done.put_nowait((position, path))
+                    except _ServerOverloadedError as overloaded:
+                        limiter.record_overload()
+                        if attempt < self.cfg.max_attempts:
+                            queue.put_nowait((position, url, attempt + 1))
+                        delay = max(delay, overloaded.retry_after_s)
+                    except asyncio.TimeoutError:
+                        # _scrape_one already absorbs fetch and parse errors; anything else is a bug and propagates.
+                        print(f"Timed out after {page_timeout_s:g}s: {url}")
+                # brief politeness delay between this worker's requests
+                await asyncio.sleep(delay)
+
+        workers = asyncio.gather(*(worker() for _ in range(self.cfg.max_concurrency)))
+        workers.add_done_callback(lambda _: done.put_nowait(None))
+        try:
+            while (item := await done.get()) is not None:
+                yield item
+        finally:
+            # Cancels the remaining requests if the caller stopped iterating early.
+            workers.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await workers
 
     async def _scrape_one(self, client: httpx.AsyncClient, url: str) -> Path | None:
         if not self._allowed(url):
             return None
 
-        async with self._sem:
-            try:
-                resp = await client.get(url)
-                resp.raise_for_status()
-                html = resp.text
-                data = extruct.extract(
-                    html,
-                    base_url=url,
-                    syntaxes=["json-ld"],
-                    uniform=True,
-                ).get("json-ld", [])
-
-                # Filter to LearningResource objects if requested
-                if self.cfg.filter_learning_resource_only:
-                    data = [obj for obj in data if _is_learning_resource(obj)]
-
-                if not data:
-                    return None
-
-                out_file = self._output_path_for(url)
-                out_file.parent.mkdir(parents=True, exist_ok=True)
-                with out_file.open("w", encoding="utf-8") as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
-                return out_file
-            except (httpx.HTTPError, httpx.TimeoutException, OSError, ValueError):
+        try:
+            data = await _stream_jsonld_items(client, url, self.cfg.max_page_bytes)
+
+            # Filter to LearningResource objects if requested
+            if self.cfg.filter_learning_resource_only:
+                data = [obj for obj in data if _is_learning_resource(obj)]
+
+            if not data:
                 return None
 
+            out_file = self._output_path_for(url)
+            out_file.parent.mkdir(parents=True, exist_ok=True)
+            with out_file.open("w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            return out_file
+        except (httpx.HTTPError, httpx.TimeoutException, OSError, ValueError, etree.LxmlError):
+            return None
+
     def _output_path_for(self, url: str) -> Path:
         """Generate safe filesystem path for a URL's JSON-LD output.
 
@@ -218,33 +333,164 @@ class GTNSitemapScraper:
         return self.cfg.out_dir / safe
 
 
-def _extract_xml_tags(xml: str, tag: str) -> list[str]:
-    """Extract text content from all instances of an XML tag.
+class _ServerOverloadedError(Exception):
+    """Raised for a 429/503 response so the scraper backs off and retries the page."""
+
+    def __init__(self, retry_after_s: float) -> None:
+        super().__init__(retry_after_s)
+        self.retry_after_s = retry_after_s
+
+
+def _retry_after_s(resp: httpx.Response) -> float:
+    """Return a numeric Retry-After header in seconds, or 0 when absent or a date."""
+    try:
+        return max(0.0, float(resp.headers.get("Retry-After", 0)))
+    except ValueError:
+        return 0.0
+
+
+class _AdaptiveLimiter:
+    """Cap in-flight requests with additive increase / multiplicative decrease.
+
+    The limit starts at ``maximum``, halves (down to one) on every overload
+    response and grows back by ``1 / limit`` per success, i.e. about one extra
+    request per round of successful requests, like TCP congestion control.
+    """
+
+    def __init__(self, maximum: int) -> None:
+        self.maximum = max(1, maximum)
+        self.limit = float(self.maximum)
+        self._in_flight = 0
+        self._changed = asyncio.Condition()
+
+    async def __aenter__(self) -> None:
+        async with self._changed:
+            await self._changed.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        async with self._changed:
+            self._in_flight -= 1
+            self._changed.notify_all()
+
+    def record_success(self) -> None:
+        self.limit = min(self.maximum, self.limit + 1 / self.limit)
+
+    def record_overload(self) -> None:
+        self.limit = max(1.0, self.limit / 2)
+
 
-    Minimalistic tag extraction without XML parser dependencies.
-    Sufficient for extracting <loc> tags from sitemaps.
+async def _stream_sitemap_locs(client: httpx.AsyncClient, url: str) -> tuple[bool, list[str]]:
+    """Stream a sitemap and collect the text of its <loc> elements.
+
+    The body is fed to an incremental XML parser chunk by chunk and each entry is
+    dropped once read, so only one entry is held in memory at a time. Tags are
+    matched by local name, with or without the sitemap namespace.
+
+    Args:
+        client: HTTP client used for the request
+        url: Sitemap or sitemap index URL
+
+    Returns:
+        Whether the document is a sitemap index, and the <loc> values in order.
+        Malformed XML stops parsing and keeps the values read so far.
+
+    Raises:
+        httpx.HTTPError: If the request fails or returns a non-success status
+    """
+    parser: ET.XMLPullParser[ET.Element] = ET.XMLPullParser(events=("start", "end"))
+    root: ET.Element | None = None
+    locs: list[str] = []
+    async with client.stream("GET", url) as response:
+        response.raise_for_status()
+        try:
+            async for chunk in response.aiter_bytes():
+                parser.feed(chunk)
+                # Only start/end events are requested, so every event carries an element.
+                for event, elem in cast(Iterator[tuple[str, ET.Element]], parser.read_events()):
+                    if root is None:
+                        root = elem
+                    elif event == "end" and elem.tag.rpartition("}")[2] == "loc":
+                        locs.append((elem.text or "").strip())
+                    elif event == "end" and elem in root:
+                        # A finished <url>/<sitemap> entry; its <loc> is already read.
+                        root.remove(elem)
+        except ET.ParseError:
+            pass
+    is_index = root is not None and root.tag.rpartition("}")[2] == "sitemapindex"
+    return is_index, locs
+
+
+async def _stream_jsonld_items(client: httpx.AsyncClient, url: str, max_bytes: int) -> list[Any]:
+    """Stream a page and collect the items of its JSON-LD scripts.
+
+    The body is fed to an incremental HTML parser chunk by chunk instead of being
+    buffered and decoded whole. GTN emits its JSON-LD in <head>, so once </head>
+    has been seen with at least one item the rest of the page is not downloaded.
+    Each script is decoded by extruct's JSON-LD extractor, as before.
+
+    Responses that are not HTML, or that declare more than ``max_bytes``, are not
+    read at all; otherwise reading stops after ``max_bytes``.
 
     Args:
-        xml: XML document as string
-        tag: Tag name to extract (e.g., "loc")
+        client: HTTP client used for the request
+        url: Page URL
+        max_bytes: Largest page body to read
 
     Returns:
-        List of text content from all matching tags
+        The JSON-LD items in document order.
+
+    Raises:
+        _ServerOverloadedError: If the server answers 429 or 503
+        httpx.HTTPError: If the request fails or returns a non-success status
+    """
+    extractor = extruct.JsonLdExtractor()
+    items: list[Any] = []
+    async with client.stream("GET", url) as response:
+        if response.status_code in OVERLOAD_STATUS_CODES:
+            raise _ServerOverloadedError(_retry_after_s(response))
+        response.raise_for_status()
+        content_type = response.headers.get("Content-Type", "text/html").partition(";")[0].strip().lower()
+        if content_type not in HTML_CONTENT_TYPES or int(response.headers.get("Content-Length", 0)) > max_bytes:
+            return items
+        parser = etree.HTMLPullParser(events=("end",), tag=("head", "script"), encoding=response.encoding)
+
+        def read_events() -> bool:
+            # Returns True once the head is complete and has yielded JSON-LD.
+            for _, elem in parser.read_events():
+                if elem.tag == "script" and elem.get("type") == JSONLD_SCRIPT_TYPE:
+                    items.extend(extractor.extract_items(elem, base_url=url))
+                    elem.clear()
+                elif elem.tag == "head" and items:
+                    return True
+            return False
+
+        received = 0
+        async for chunk in response.aiter_bytes():
+            parser.feed(chunk)
+            if read_events():
+                return items
+            received += len(chunk)
+            if received >= max_bytes:
+                break
+        parser.close()
+        read_events()
+    return items
+
+
+def _is_training_page(url: str) -> bool:
+    """Check if a sitemap URL is a GTN training page likely to contain JSON-LD.
+
+    Targets tutorial.html and slides.html pages (not FAQs, workflows, experiences).
     """
-    open_tag = f"<{tag}>"
-    close_tag = f"</{tag}>"
-    out: list[str] = []
-    i = 0
-    while True:
-        i = xml.find(open_tag, i)
-        if i == -1:
-            break
-        j = xml.find(close_tag, i + len(open_tag))
-        if j == -1:
-            break
-        out.append(xml[i + len(open_tag) : j].strip())
-        i = j + len(close_tag)
-    return out
+    return (
+        "/training-material/topics/" in url
+        and "/tutorials/" in url
+        and (url.endswith(_TRAINING_PAGE_SUFFIXES) or "/slides-plain.html" in url)
+        and "/faqs/" not in url
+        and "/workflows/" not in url
+        and "/experiences/" not in url
+    )
 
 
 def _is_learning_resource(obj: Any) -> bool:
@@ -269,34 +515,15 @@ def _is_learning_resource(obj: Any) -> bool:
     return False
 
 
-def _chunked(iterable: Iterable[Any], size: int) -> Iterable[list[Any]]:
-    """Split an iterable into fixed-size chunks.
-
-    Args:
-        iterable: Input iterable to chunk
-        size: Maximum number of items per chunk
-
-    Yields:
-        Lists of items, each containing up to 'size' elements
-    """
-    buf: list[Any] = []
-    for item in iterable:
-        buf.append(item)
-        if len(buf) == size:
-            yield buf
-            buf = []
-    if buf:
-        yield buf
-
-
 def cli() -> None:
     parser = argparse.ArgumentParser(description="Scrape GTN sitemap and extract JSON-LD")
     parser.add_argument("--base-url", default=DEFAULT_BASE_URL, help="GTN base URL")
     parser.add_argument("--out-dir", default="data/gtn_jsonld", help="Output directory for .jsonld files")
     parser.add_argument("--max-urls", type=int, default=50, help="Limit number of URLs (for testing)")
     parser.add_argument("--concurrency", type=int, default=5, help="Max concurrent fetches")
-    parser.add_argument("--delay", type=float, default=0.5, help="Delay between request chunks (seconds)")
+    parser.add_argument("--delay", type=float, default=0.5, help="Delay between requests per worker (seconds)")
     parser.add_argument("--no-robots", action="store_true", help="Ignore robots.txt (not recommended)")
+    parser.add_argument("--no-cache", action="store_true", help="Always re-fetch robots.txt and the sitemaps")
     parser.add_argument(
         "--include-non-learning",
         action="store_true",
@@ -311,11 +538,12 @@ def cli() -> None:
         request_delay_s=args.delay,
         respect_robots=not args.no_robots,
         filter_learning_resource_only=not args.include_non_learning,
+        cache_dir=None if args.no_cache else ScrapeConfig.cache_dir,
     )
 
     async def _run() -> None:
-        scraper = GTNSitemapScraper(cfg)
-        files = await scraper.scrape_all(max_urls=args.max_urls)
+        async with GTNSitemapScraper(cfg) as scraper:
+            files = await scraper.scrape_all(max_urls=args.max_urls)
         print(f"Saved {len(files)} JSON-LD files to {cfg.out_dir}")
 
     asyncio.run(_run())
@@ -323,6 +551,7 @@ def cli() -> None:
 
 JSONLD_DIR = Path("data/gtn_jsonld")
 OUTPUT_TTL = Path("data/gtn_output.ttl")
+_XSD_STRING = "http://www.w3.org/2001/XMLSchema#string"
 
 # ---- Local contexts ----
 LOCAL_CONTEXT = {
@@ -456,7 +685,64 @@ def nodes_to_nquads(nodes: list[dict[str, Any]]) -> Any:
     return nquads
 
 
-def jsonld_to_ttl() -> None:
+def nodes_to_triples(nodes: list[dict[str, Any]]) -> Iterator[tuple[Node, Node, Node]]:
+    """Convert JSON-LD nodes to rdflib triples without an N-Quads round trip.
+
+    Expands like ``nodes_to_nquads`` but builds rdflib terms straight from pyld's
+    RDF dataset, so no N-Quads text is written and parsed again. Blank node labels
+    are scoped to this call, as they would be for one parse of its N-Quads.
+
+    Args:
+        nodes: List of JSON-LD node dictionaries (already cleaned by load_jsonld_file)
+
+    Yields:
+        (subject, predicate, object) triples from every graph of the document
+
+    Raises:
+        RuntimeError: If pyld tries to fetch an unknown context URL
+        ValueError: If JSON-LD expansion fails
+    """
+    return _dataset_triples(_rdf_dataset(nodes))
+
+
+def _rdf_dataset(nodes: list[dict[str, Any]]) -> dict[str, list[dict[str, Any]]]:
+    doc = {"@context": LOCAL_CONTEXT, "@graph": nodes}
+    return cast(dict[str, list[dict[str, Any]]], jsonld.to_rdf(jsonld.expand(doc)))
+
+
+def _dataset_triples(dataset: dict[str, list[dict[str, Any]]]) -> Iterator[tuple[Node, Node, Node]]:
+    bnodes: dict[str, BNode] = {}
+
+    def term(value: dict[str, Any]) -> Node:
+        if value["type"] == "IRI":
+            return URIRef(value["value"])
+        if value["type"] == "blank node":
+            return bnodes.setdefault(value["value"], BNode())
+        if "language" in value:
+            return Literal(value["value"], lang=value["language"])
+        if value["datatype"] == _XSD_STRING:
+            return Literal(value["value"])
+        return Literal(value["value"], datatype=URIRef(value["datatype"]))
+
+    for triples in dataset.values():
+        for triple in triples:
+            yield term(triple["subject"]), term(triple["predicate"]), term(triple["object"])
+
+
+def _expand_file(path: Path) -> tuple[dict[str, list[dict[str, Any]]], str | None]:
+    """Load and expand one JSON-LD file; returns its RDF dataset and any error message.
+
+    Runs in worker processes, so it returns pyld's plain dicts (cheap to pickle)
+    and the parent builds the rdflib terms.
+    """
+    try:
+        nodes = load_jsonld_file(path)
+        return (_rdf_dataset(nodes) if nodes else {}), None
+    except (json.JSONDecodeError, OSError, RuntimeError, ValueError) as e:
+        return {}, str(e)
+
+
+def jsonld_to_ttl(max_workers: int | None = None) -> None:
     """Main entry point: load all JSON-LD files and serialize to Turtle.
 
     Processes all .jsonld files in JSONLD_DIR, converts them to RDF triples using
@@ -465,8 +751,9 @@ def jsonld_to_ttl() -> None:
     The function:
     1. Discovers all .jsonld files recursively
     2. Loads and cleans each file (promotes id to @id, strips nested contexts)
-    3. Converts to N-Quads via pyld with offline loader
-    4. Merges into single rdflib Graph
+    3. Converts to RDF via pyld with offline loader, in ``max_workers`` processes
+       (default: CPU count)
+    4. Adds the triples straight into a single rdflib Graph, in file order
     5. Serializes to Turtle format with bound prefixes
 
     Raises:
@@ -484,21 +771,24 @@ def jsonld_to_ttl() -> None:
     g.bind("bioschemas", "https://bioschemas.org/")
 
     ok = err = 0
-    for i, fp in enumerate(files, 1):
-        try:
-            nodes = load_jsonld_file(fp)
-            if not nodes:
+    workers = min(len(files), max_workers or os.cpu_count() or 1)
+    with contextlib.ExitStack() as stack:
+        if workers > 1:
+            # pyld expansion is pure Python and CPU-bound, so spread files over processes
+            executor = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+            expanded = executor.map(_expand_file, files, chunksize=16)
+        else:
+            expanded = map(_expand_file, files)
+        for i, (fp, (dataset, error)) in enumerate(zip(files, expanded, strict=True), 1):
+            if error is None:
+                g += _dataset_triples(dataset)
                 ok += 1
             else:
-                nquads = nodes_to_nquads(nodes)
-                g.parse(data=nquads, format="nquads")
-                ok += 1
-        except (json.JSONDecodeError, OSError, RuntimeError, ValueError) as e:
-            err += 1
-            print(f" {fp.name}: {e}")
+                err += 1
+                print(f" {fp.name}: {error}")
 
-        if i % 100 == 0 or i == len(files):
-            print(f"  Processed {i}/{len(files)} | triples: {len(g):,} | files OK:{ok} ERR:{err}")
+            if i % 100 == 0 or i == len(files):
+                print(f"  Processed {i}/{len(files)} | triples: {len(g):,} | files OK:{ok} ERR:{err}")
 
     OUTPUT_TTL.parent.mkdir(parents=True, exist_ok=True)
     g.serialize(OUTPUT_TTL, format="turtle")
@@ -7,17 +7,23 @@ objects. They are re-exported here so callers can do either
 `from elixir_training_mcp.indexes import KeywordIndex`, as preferred.
 """
 
-from .keyword import KeywordIndex
-from .provider import ProviderIndex
-from .location import LocationIndex
-from .date import CourseSchedule, DateIndex
-from .topic import TopicIndex
+from .keyword import KeywordIndex, KeywordIndexBuilder, collect_keyword_tokens
+from .provider import ProviderIndex, ProviderIndexBuilder
+from .location import LocationIndex, LocationIndexBuilder
+from .date import CourseSchedule, DateIndex, DateIndexBuilder
+from .topic import TopicIndex, TopicIndexBuilder
 
 __all__ = [
     "CourseSchedule",
     "DateIndex",
+    "DateIndexBuilder",
     "KeywordIndex",
+    "KeywordIndexBuilder",
     "LocationIndex",
+    "LocationIndexBuilder",
     "ProviderIndex",
+    "ProviderIndexBuilder",
     "TopicIndex",
+    "TopicIndexBuilder",
+    "collect_keyword_tokens",
 ]
@@ -1,15 +1,17 @@
 from __future__ import annotations
 
+from array import array
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
 from datetime import date, datetime
-from types import MappingProxyType
-from typing import Mapping
+from itertools import compress
+from typing import Iterable, Mapping
 
 from ..data_models import TrainingResource
-from .utils import normalize_datetime_input
+from .utils import cached_lookup, from_epoch_micros, input_to_epoch_micros, to_epoch_micros
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CourseSchedule:
     resource_uri: str
     start: datetime
@@ -18,24 +20,35 @@ class CourseSchedule:
 
 @dataclass(frozen=True)
 class DateIndex:
-    _schedules: tuple[CourseSchedule, ...]
+    # Parallel arrays sorted by start so range bounds can be bisected. Times
+    # are int64 microseconds since the UTC epoch; ``_ends`` holds the effective
+    # end (the start for open-ended schedules) and ``_open_ended`` flags those.
+    _starts: array[int]
+    _ends: array[int]
+    _open_ended: bytes
+    _uris: tuple[str, ...]
+    # Auxiliary index: effective ends in sorted order, with the matching
+    # positions into the start-sorted arrays.
+    _sorted_ends: array[int]
+    _end_order: array[int]
 
     @classmethod
     def from_resources(cls, resources: Mapping[str, TrainingResource]) -> "DateIndex":
-        schedules: list[CourseSchedule] = []
+        builder = DateIndexBuilder()
         for uri, resource in resources.items():
-            for instance in resource.course_instances:
-                if instance.start_date is None:
-                    continue
-                schedules.append(
-                    CourseSchedule(
-                        resource_uri=uri,
-                        start=instance.start_date,
-                        end=instance.end_date,
-                    )
-                )
-        schedules.sort(key=lambda schedule: schedule.start)
-        return cls(tuple(schedules))
+            builder.add(uri, resource)
+        return builder.build()
+
+    @property
+    def schedules(self) -> tuple[CourseSchedule, ...]:
+        return tuple(
+            CourseSchedule(
+                resource_uri=uri,
+                start=from_epoch_micros(start),
+                end=None if open_ended else from_epoch_micros(end),
+            )
+            for start, end, open_ended, uri in zip(self._starts, self._ends, self._open_ended, self._uris, strict=True)
+        )
 
     def lookup(
         self,
@@ -43,21 +56,77 @@ class DateIndex:
         end: datetime | date | None = None,
         limit: int | None = None,
     ) -> list[str]:
-        start_dt = normalize_datetime_input(start)
-        end_dt = normalize_datetime_input(end)
-
-        results: list[str] = []
-        for schedule in self._schedules:
-            if start_dt:
-                if schedule.end:
-                    if schedule.end < start_dt:
-                        continue
-                elif schedule.start < start_dt:
-                    continue
-            if end_dt and schedule.start > end_dt:
-                continue
-            if schedule.resource_uri not in results:
-                results.append(schedule.resource_uri)
-                if limit is not None and len(results) >= limit:
+        return list(self._lookup_range(input_to_epoch_micros(start), input_to_epoch_micros(end), limit))
+
+    @cached_lookup
+    def _lookup_range(self, start_us: int | None, end_us: int | None, limit: int | None) -> tuple[str, ...]:
+        # Schedules starting after the window can never match; bound the scan there.
+        upper = bisect_right(self._starts, end_us) if end_us is not None else len(self._starts)
+        positions: Iterable[int] = range(upper)
+        if start_us is not None:
+            # Schedules ending before the window can never match either. Use the
+            # end-sorted index when it yields fewer candidates than the start bound.
+            lower = bisect_left(self._sorted_ends, start_us)
+            if len(self._end_order) - lower < upper:
+                positions = sorted(position for position in self._end_order[lower:] if position < upper)
+            else:
+                # Filter in C: compress keeps positions whose effective end is >= start_us.
+                positions = compress(range(upper), map(start_us.__le__, self._ends))
+
+        # A dict doubles as an insertion-ordered set: one hash write per new URI.
+        # The limit check is loop-invariant, so each shape gets its own loop.
+        seen: dict[str, None] = {}
+        uris = self._uris
+        if limit is None:
+            for position in positions:
+                uri = uris[position]
+                if uri not in seen:
+                    seen[uri] = None
+            return tuple(seen)
+        for position in positions:
+            uri = uris[position]
+            if uri not in seen:
+                seen[uri] = None
+                if len(seen) >= limit:
                     break
-        return results
+        return tuple(seen)
+
+
+class DateIndexBuilder:
+    """Accumulate course schedules one resource at a time."""
+
+    def __init__(self) -> None:
+        # Parallel typed columns in insertion order; no per-schedule objects are built.
+        self._starts = array("q")
+        self._ends = array("q")
+        self._open_ended = bytearray()
+        self._uris: list[str] = []
+
+    def add(self, uri: str, resource: TrainingResource) -> None:
+        for instance in resource.course_instances:
+            self.add_schedule(uri, instance.start_date, instance.end_date)
+
+    def add_schedule(self, uri: str, start_date: datetime | None, end_date: datetime | None) -> None:
+        """Add one raw schedule row; rows without a start date are skipped."""
+        if start_date is None:
+            return
+        start = to_epoch_micros(start_date)
+        self._starts.append(start)
+        self._ends.append(start if end_date is None else to_epoch_micros(end_date))
+        self._open_ended.append(end_date is None)
+        self._uris.append(uri)
+
+    def build(self) -> DateIndex:
+        # Stable sort by start, matching the original schedule order for ties.
+        order = sorted(range(len(self._starts)), key=self._starts.__getitem__)
+        starts = array("q", (self._starts[position] for position in order))
+        ends = array("q", (self._ends[position] for position in order))
+        end_order = array("I", sorted(range(len(ends)), key=ends.__getitem__))
+        return DateIndex(
+            starts,
+            ends,
+            bytes(self._open_ended[position] for position in order),
+            tuple(self._uris[position] for position in order),
+            array("q", (ends[position] for position in end_order)),
+            end_order,
+        )
@@ -1,63 +1,84 @@
 from __future__ import annotations
 
+from array import array
 from collections import defaultdict
 from dataclasses import dataclass
-from types import MappingProxyType
 from typing import Mapping
 
 from ..data_models import TrainingResource
-from .utils import append_unique, tokenize
+from ..text import collect_keyword_tokens, tokenize
+from .utils import cached_lookup
 
 
 @dataclass(frozen=True)
 class KeywordIndex:
-    _token_to_resources: Mapping[str, tuple[str, ...]]
+    # Postings for every token are packed back to back as integer URI ids;
+    # token ``t`` owns ``_postings[_offsets[slot]:_offsets[slot + 1]]`` where
+    # ``slot = _token_slots[t]``, and ids resolve through ``_uris``.
+    _uris: tuple[str, ...]
+    _token_slots: dict[str, int]
+    _offsets: array[int]
+    _postings: array[int]
 
     @classmethod
     def from_resources(cls, resources: Mapping[str, TrainingResource]) -> "KeywordIndex":
-        token_map: dict[str, list[str]] = defaultdict(list)
+        builder = KeywordIndexBuilder()
         for uri, resource in resources.items():
-            tokens = _collect_keyword_tokens(resource)
-            for token in tokens:
-                append_unique(token_map[token], uri)
-        immutable = {token: tuple(uris) for token, uris in token_map.items()}
-        return cls(MappingProxyType(immutable))
+            builder.add(uri, resource)
+        return builder.build()
 
     def lookup(self, query: str, limit: int | None = None) -> list[str]:
-        tokens = tokenize(query)
-        seen_set: set[str] = set()
-        seen_list: list[str] = []
+        return list(self._lookup_tokens(tuple(tokenize(query)), limit))
+
+    @cached_lookup
+    def _lookup_tokens(self, tokens: tuple[str, ...], limit: int | None) -> tuple[str, ...]:
+        if limit is None and len(tokens) == 1:
+            # A single posting list holds each URI id once; no dedup needed.
+            slot = self._token_slots.get(tokens[0])
+            if slot is None:
+                return ()
+            postings = self._postings[self._offsets[slot] : self._offsets[slot + 1]]
+            return tuple(map(self._uris.__getitem__, postings))
+
+        seen = bytearray(len(self._uris))
+        results: list[str] = []
         for token in tokens:
-            for uri in self._token_to_resources.get(token, ()):
-                if uri not in seen_set:
-                    seen_set.add(uri)
-                    seen_list.append(uri)
-                    if limit is not None and len(seen_list) >= limit:
-                        return seen_list
-        return seen_list
-
-
-def _collect_keyword_tokens(resource: TrainingResource) -> set[str]:
-    texts: list[str] = []
-    for text in (
-        resource.name,
-        resource.description,
-        resource.abstract,
-        resource.headline,
-        resource.interactivity_type,
-        resource.language,
-    ):
-        if text:
-            texts.append(text)
-
-    texts.extend(resource.keywords)
-    texts.extend(resource.learning_resource_types)
-    texts.extend(resource.educational_levels)
-    texts.extend(resource.prerequisites)
-    texts.extend(resource.teaches)
-
-    tokens: set[str] = set()
-    for text in texts:
-        for token in tokenize(text):
-            tokens.add(token)
-    return tokens
+            slot = self._token_slots.get(token)
+            if slot is None:
+                continue
+            for uri_id in self._postings[self._offsets[slot] : self._offsets[slot + 1]]:
+                if not seen[uri_id]:
+                    seen[uri_id] = 1
+                    results.append(self._uris[uri_id])
+                    if limit is not None and len(results) >= limit:
+                        return tuple(results)
+        return tuple(results)
+
+
+class KeywordIndexBuilder:
+    """Accumulate keyword postings one resource at a time."""
+
+    def __init__(self) -> None:
+        self._uris: list[str] = []
+        # Each resource is added once and its tokens are already a set, so
+        # buckets can be appended to without a dedup check.
+        self._token_map: dict[str, list[int]] = defaultdict(list)
+
+    def add(self, uri: str, resource: TrainingResource) -> None:
+        """Index a resource under its parse-time tokens, tokenizing hand-built ones here."""
+        tokens = resource.keyword_tokens or collect_keyword_tokens(resource)
+        uri_id = len(self._uris)
+        self._uris.append(uri)
+        for token in tokens:
+            self._token_map[token].append(uri_id)
+
+    def build(self) -> KeywordIndex:
+        token_slots: dict[str, int] = {}
+        offsets = array("I", [0])
+        postings = array("I")
+        for slot, (token, uri_ids) in enumerate(self._token_map.items()):
+            token_slots[token] = slot
+            postings.extend(uri_ids)
+            offsets.append(len(postings))
+        return KeywordIndex(tuple(self._uris), token_slots, offsets, postings)
+
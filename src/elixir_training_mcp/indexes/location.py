@@ -2,48 +2,71 @@ from __future__ import annotations
 
 from collections import defaultdict
 from dataclasses import dataclass
-from types import MappingProxyType
-from typing import Mapping
+from itertools import islice
+from typing import Iterable, Mapping
 
 from ..data_models import TrainingResource
-from .utils import append_unique
+from .utils import normalize_key
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LocationIndex:
-    _country_map: Mapping[str, tuple[str, ...]]
-    _country_city_map: Mapping[tuple[str, str], tuple[str, ...]]
+    _country_map: dict[str, tuple[str, ...]]
+    _country_city_map: dict[tuple[str, str], tuple[str, ...]]
 
     @classmethod
     def from_resources(cls, resources: Mapping[str, TrainingResource]) -> "LocationIndex":
-        country_map: dict[str, list[str]] = defaultdict(list)
-        country_city_map: dict[tuple[str, str], list[str]] = defaultdict(list)
-
+        builder = LocationIndexBuilder()
         for uri, resource in resources.items():
-            for instance in resource.course_instances:
-                if not instance.country:
-                    continue
-                country_key = instance.country.strip().lower()
-                append_unique(country_map[country_key], uri)
-
-                if instance.locality:
-                    city_key = instance.locality.strip().lower()
-                    append_unique(country_city_map[(country_key, city_key)], uri)
-
-        immutable_country = {key: tuple(uris) for key, uris in country_map.items()}
-        immutable_city = {key: tuple(uris) for key, uris in country_city_map.items()}
-        return cls(
-            MappingProxyType(immutable_country),
-            MappingProxyType(immutable_city),
-        )
+            builder.add(uri, resource)
+        return builder.build()
 
     def lookup(self, country: str, city: str | None = None, limit: int | None = None) -> list[str]:
-        country_key = country.strip().lower()
+        return list(self.lookup_iter(country, city=city, limit=limit))
+
+    def lookup_iter(self, country: str, city: str | None = None, limit: int | None = None) -> Iterable[str]:
+        """Iterate matching URIs straight from the stored bucket without copying it."""
+        country_key = normalize_key(country)
         if city:
-            city_key = city.strip().lower()
-            results = list(self._country_city_map.get((country_key, city_key), ()))
+            bucket = self._country_city_map.get((country_key, normalize_key(city)), ())
         else:
-            results = list(self._country_map.get(country_key, ()))
-        if limit is not None:
-            return results[:limit]
-        return results
+            bucket = self._country_map.get(country_key, ())
+        return bucket if limit is None else islice(bucket, limit)
+
+
+class LocationIndexBuilder:
+    """Accumulate country and (country, city) buckets one resource at a time."""
+
+    def __init__(self) -> None:
+        self._country_map: dict[str, dict[str, None]] = defaultdict(dict)
+        self._country_city_map: dict[tuple[str, str], dict[str, None]] = defaultdict(dict)
+        # Builder-local memo of raw -> normalized place names. Course instances
+        # repeat the same handful of countries and cities, and the shared
+        # normalize_key LRU is churned by topic keys during a fused build.
+        self._normalized: dict[str, str] = {}
+
+    def add(self, uri: str, resource: TrainingResource) -> None:
+        for instance in resource.course_instances:
+            self.add_place(uri, instance.country, instance.locality)
+
+    def add_place(self, uri: str, country: str | None, locality: str | None) -> None:
+        """Add one raw location row; rows without a country are skipped."""
+        if not country:
+            return
+        country_key = self._normalize(country)
+        self._country_map[country_key][uri] = None
+
+        if locality:
+            city_key = self._normalize(locality)
+            self._country_city_map[(country_key, city_key)][uri] = None
+
+    def _normalize(self, value: str) -> str:
+        key = self._normalized.get(value)
+        if key is None:
+            key = self._normalized[value] = normalize_key(value)
+        return key
+
+    def build(self) -> LocationIndex:
+        immutable_country = {key: tuple(uris) for key, uris in self._country_map.items()}
+        immutable_city = {key: tuple(uris) for key, uris in self._country_city_map.items()}
+        return LocationIndex(immutable_country, immutable_city)
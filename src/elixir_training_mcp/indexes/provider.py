@@ -2,30 +2,46 @@ from __future__ import annotations
 
 from collections import defaultdict
 from dataclasses import dataclass
-from types import MappingProxyType
-from typing import Mapping
+from itertools import islice
+from typing import Iterable, Mapping
 
 from ..data_models import TrainingResource
-from .utils import append_unique
+from .utils import normalize_key
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProviderIndex:
-    _provider_to_resources: Mapping[str, tuple[str, ...]]
+    # Plain dicts throughout the indexes: fields are private and never mutated
+    # after build, so lookups skip the read-only proxy indirection.
+    _provider_to_resources: dict[str, tuple[str, ...]]
 
     @classmethod
     def from_resources(cls, resources: Mapping[str, TrainingResource]) -> "ProviderIndex":
-        provider_map: dict[str, list[str]] = defaultdict(list)
+        builder = ProviderIndexBuilder()
         for uri, resource in resources.items():
-            if resource.provider and resource.provider.name:
-                key = resource.provider.name.strip().lower()
-                append_unique(provider_map[key], uri)
-        immutable = {provider: tuple(uris) for provider, uris in provider_map.items()}
-        return cls(MappingProxyType(immutable))
+            builder.add(uri, resource)
+        return builder.build()
 
     def lookup(self, provider_name: str, limit: int | None = None) -> list[str]:
-        key = provider_name.strip().lower()
-        results = list(self._provider_to_resources.get(key, ()))
-        if limit is not None:
-            return results[:limit]
-        return results
+        return list(self.lookup_iter(provider_name, limit=limit))
+
+    def lookup_iter(self, provider_name: str, limit: int | None = None) -> Iterable[str]:
+        """Iterate matching URIs straight from the stored bucket without copying it."""
+        bucket = self._provider_to_resources.get(normalize_key(provider_name), ())
+        return bucket if limit is None else islice(bucket, limit)
+
+
+class ProviderIndexBuilder:
+    """Accumulate provider buckets one resource at a time."""
+
+    def __init__(self) -> None:
+        # A resource has a single provider, so each URI lands in one bucket once.
+        self._provider_map: dict[str, list[str]] = defaultdict(list)
+
+    def add(self, uri: str, resource: TrainingResource) -> None:
+        if resource.provider and resource.provider.name:
+            self._provider_map[normalize_key(resource.provider.name)].append(uri)
+
+    def build(self) -> ProviderIndex:
+        immutable = {provider: tuple(uris) for provider, uris in self._provider_map.items()}
+        return ProviderIndex(immutable)
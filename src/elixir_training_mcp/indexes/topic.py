@@ -2,33 +2,53 @@ from __future__ import annotations
 
 from collections import defaultdict
 from dataclasses import dataclass
-from types import MappingProxyType
-from typing import Mapping
+from itertools import islice
+from typing import Iterable, Mapping
 
 from ..data_models import TrainingResource
-from .utils import append_unique
+from .utils import normalize_key
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TopicIndex:
-    _topic_to_resources: Mapping[str, tuple[str, ...]]
+    _topic_to_resources: dict[str, tuple[str, ...]]
 
     @classmethod
     def from_resources(cls, resources: Mapping[str, TrainingResource]) -> "TopicIndex":
-        topic_map: dict[str, list[str]] = defaultdict(list)
+        builder = TopicIndexBuilder()
         for uri, resource in resources.items():
-            for topic in resource.topics:
-                normalized_topic = topic.strip().lower()
-                append_unique(topic_map[normalized_topic], uri)
-                if "/" in topic:
-                    short_name = topic.rsplit("/", 1)[-1].lower()
-                    append_unique(topic_map[short_name], uri)
-        immutable = {topic: tuple(uris) for topic, uris in topic_map.items()}
-        return cls(MappingProxyType(immutable))
+            builder.add(uri, resource)
+        return builder.build()
 
     def lookup(self, topic: str, limit: int | None = None) -> list[str]:
-        key = topic.strip().lower()
-        results = list(self._topic_to_resources.get(key, ()))
-        if limit is not None:
-            return results[:limit]
-        return results
+        return list(self.lookup_iter(topic, limit=limit))
+
+    def lookup_iter(self, topic: str, limit: int | None = None) -> Iterable[str]:
+        """Iterate matching URIs straight from the stored bucket without copying it."""
+        bucket = self._topic_to_resources.get(normalize_key(topic), ())
+        return bucket if limit is None else islice(bucket, limit)
+
+
+class TopicIndexBuilder:
+    """Accumulate topic buckets one resource at a time."""
+
+    def __init__(self) -> None:
+        self._topic_map: dict[str, list[str]] = defaultdict(list)
+
+    def add(self, uri: str, resource: TrainingResource) -> None:
+        for key in _collect_topic_keys(resource):
+            self._topic_map[key].append(uri)
+
+    def build(self) -> TopicIndex:
+        immutable = {topic: tuple(uris) for topic, uris in self._topic_map.items()}
+        return TopicIndex(immutable)
+
+
+def _collect_topic_keys(resource: TrainingResource) -> set[str]:
+    keys: set[str] = set()
+    for topic in resource.topics:
+        keys.add(normalize_key(topic))
+        _, separator, short_name = topic.rpartition("/")
+        if separator:
+            keys.add(normalize_key(short_name))
+    return keys
@@ -1,23 +1,59 @@
 from __future__ import annotations
 
-from datetime import date, datetime, timezone
-import re
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache, wraps
+import sys
+import weakref
+from collections.abc import Callable, Hashable
+from typing import Any
 
-TOKEN_PATTERN = re.compile(r"[A-Za-z0-9]+")
+LOOKUP_CACHE_SIZE = 512
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+_EPOCH_ORDINAL = _EPOCH.toordinal()
+_MICROS_PER_DAY = 86_400_000_000
+# Lookup caches keyed by (id(index), method name). Keeping them off the instance
+# means an index never references itself and always pickles as plain data.
+_LOOKUP_CACHES: dict[tuple[int, str], Callable[..., tuple[str, ...]]] = {}
 
 
-def tokenize(text: str | None) -> list[str]:
-    """Normalize text to lowercase tokens."""
-    if not text:
-        return []
-    lower_text = text.lower()
-    return list(TOKEN_PATTERN.findall(lower_text))
+@lru_cache(maxsize=2048)
+def normalize_key(value: str) -> str:
+    """Return the interned, trimmed, lowercase form of a lookup key."""
+    return sys.intern(value.strip().lower())
 
 
-def append_unique(bucket: list[str], value: str) -> None:
-    """Append a value to a list only if it is not already present."""
-    if value not in bucket:
-        bucket.append(value)
+def cached_lookup(method: Callable[..., tuple[str, ...]]) -> Callable[..., tuple[str, ...]]:
+    """
+    Memoize an index lookup per instance with a bounded LRU.
+
+    Arguments must already be normalized and hashable. Indexes are immutable
+    once built, so cached results never need invalidating; a cache is dropped
+    when its index is garbage collected.
+    """
+    name = method.__name__
+
+    @wraps(method)
+    def wrapper(self: Any, *args: Hashable) -> tuple[str, ...]:
+        key = (id(self), name)
+        cache = _LOOKUP_CACHES.get(key)
+        if cache is None:
+            cache = _LOOKUP_CACHES[key] = _new_lookup_cache(method, weakref.ref(self))
+            weakref.finalize(self, _LOOKUP_CACHES.pop, key, None)
+        return cache(*args)
+
+    return wrapper
+
+
+def _new_lookup_cache(
+    method: Callable[..., tuple[str, ...]], index_ref: weakref.ref[Any]
+) -> Callable[..., tuple[str, ...]]:
+    # The cache holds the index weakly so it cannot keep it alive.
+    @lru_cache(maxsize=LOOKUP_CACHE_SIZE)
+    def cache(*args: Hashable) -> tuple[str, ...]:
+        return method(index_ref(), *args)
+
+    return cache
 
 
 def normalize_datetime_input(value: datetime | date | None) -> datetime | None:
@@ -25,8 +61,34 @@ def normalize_datetime_input(value: datetime | date | None) -> datetime | None:
     if value is None:
         return None
     if isinstance(value, datetime):
-        if value.tzinfo is None:
+        tzinfo = value.tzinfo
+        # Already-normalized UTC values are the common case; return them untouched.
+        if tzinfo is timezone.utc:
+            return value
+        if tzinfo is None:
             return value.replace(tzinfo=timezone.utc)
         return value.astimezone(timezone.utc)
-    combined = datetime.combine(value, datetime.min.time()).replace(tzinfo=timezone.utc)
-    return combined
+    return datetime(value.year, value.month, value.day, tzinfo=timezone.utc)
+
+
+def to_epoch_micros(value: datetime) -> int:
+    """Return an aware datetime as exact integer microseconds since the UTC epoch."""
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def input_to_epoch_micros(value: datetime | date | None) -> int | None:
+    """Normalize a lookup bound straight to UTC epoch microseconds."""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        # Aware values subtract correctly whatever their offset; naive ones are UTC.
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return to_epoch_micros(value)
+    # Plain dates are UTC midnight: whole days since the epoch, no datetime needed.
+    return (value.toordinal() - _EPOCH_ORDINAL) * _MICROS_PER_DAY
+
+
+def from_epoch_micros(value: int) -> datetime:
+    """Inverse of ``to_epoch_micros``; returns a UTC-aware datetime."""
+    return _EPOCH + timedelta(microseconds=value)
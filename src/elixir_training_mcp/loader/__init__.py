@@ -8,14 +8,18 @@ components so the orchestration layer can stay slim while behaviour remains
 unchanged.
 """
 
-from .graph import load_dataset, load_source_graph
-from .parser import extract_resources_from_graph
+from .graph import load_dataset, load_source_graph, load_sparql_store, query_sparql_store, source_graph_uri
+from .parser import extract_resources_from_file, extract_resources_from_graph
 from .dedupe import is_richer_resource, resolve_resource_identifier
 
 __all__ = [
+    "extract_resources_from_file",
     "extract_resources_from_graph",
     "is_richer_resource",
     "load_dataset",
     "load_source_graph",
+    "load_sparql_store",
     "resolve_resource_identifier",
+    "query_sparql_store",
+    "source_graph_uri",
 ]
@@ -1,17 +1,19 @@
 from __future__ import annotations
 
+from operator import attrgetter
 from typing import MutableMapping
 
-from rdflib import Graph
 from rdflib.term import BNode, Node, URIRef
 
 from ..data_models import TrainingResource
-from .utils import first_value_as_str, schema_predicates
+from .utils import ObjectLookup, first_value_as_str, schema_predicates
 
+_P_URL = schema_predicates("url")
 
-def resolve_resource_identifier(graph: Graph, subject: Node) -> str | None:
+
+def resolve_resource_identifier(graph: ObjectLookup, subject: Node) -> str | None:
     """Return a canonical identifier for a resource subject."""
-    url = first_value_as_str(graph, subject, *schema_predicates("url"))
+    url = first_value_as_str(graph, subject, *_P_URL)
     if url:
         return url
     if isinstance(subject, URIRef):
@@ -21,56 +23,48 @@ def resolve_resource_identifier(graph: Graph, subject: Node) -> str | None:
     return None
 
 
-def resource_quality(resource: TrainingResource) -> int:
-    """Score resources so richer metadata wins during deduplication."""
-    scalar_fields = [
-        "name",
-        "description",
-        "abstract",
-        "headline",
-        "url",
-        "provider",
-        "language",
-        "interactivity_type",
-        "license_url",
-        "accessibility_summary",
-        "is_accessible_for_free",
-        "is_family_friendly",
-        "creative_work_status",
-        "version",
-        "date_published",
-        "date_modified",
-    ]
-    collection_fields = [
-        "keywords",
-        "topics",
-        "identifiers",
-        "authors",
-        "contributors",
-        "prerequisites",
-        "teaches",
-        "learning_resource_types",
-        "educational_levels",
-        "access_modes",
-        "access_mode_sufficient",
-        "accessibility_controls",
-        "accessibility_features",
-        "audience_roles",
-        "course_instances",
-    ]
-
-    score = 0
-    for field in scalar_fields:
-        value = getattr(resource, field)
-        if value:
-            score += 1
+_SCALAR_FIELDS = (
+    "name",
+    "description",
+    "abstract",
+    "headline",
+    "url",
+    "provider",
+    "language",
+    "interactivity_type",
+    "license_url",
+    "accessibility_summary",
+    "is_accessible_for_free",
+    "is_family_friendly",
+    "creative_work_status",
+    "version",
+    "date_published",
+    "date_modified",
+)
+_COLLECTION_FIELDS = (
+    "keywords",
+    "topics",
+    "identifiers",
+    "authors",
+    "contributors",
+    "prerequisites",
+    "teaches",
+    "learning_resource_types",
+    "educational_levels",
+    "access_modes",
+    "access_mode_sufficient",
+    "accessibility_controls",
+    "accessibility_features",
+    "audience_roles",
+    "course_instances",
+)
+# One C-level call reads every scored field; empty collections are falsy like unset scalars.
+_scored_fields = attrgetter(*_SCALAR_FIELDS, *_COLLECTION_FIELDS)
 
-    for field in collection_fields:
-        value = getattr(resource, field)
-        if value and len(value) > 0:
-            score += 1
 
-    return score
+def resource_quality(resource: TrainingResource) -> int:
+    """Score resources so richer metadata wins during deduplication."""
+    return len(list(filter(None, _scored_fields(resource))))
 
 
 def is_richer_resource(candidate: TrainingResource, current: TrainingResource) -> bool:
@@ -1,11 +1,26 @@
 from __future__ import annotations
 
+from functools import cache
 from pathlib import Path
-from typing import Mapping, MutableMapping
+from typing import Any, Callable, Iterable, Iterator, Mapping, MutableMapping, TypeVar, cast
 
-from rdflib import Dataset, Graph, URIRef
+from rdflib import BNode, Dataset, Graph, Literal, URIRef
+from rdflib.namespace import XSD
+from rdflib.term import Node
 
-from .utils import bind_common_namespaces
+from .utils import bind_common_namespaces, uri_ref
+
+try:  # Optional Rust Turtle parser; rdflib's own parser is used when absent.
+    import pyoxigraph
+except ImportError:  # pragma: no cover - depends on the environment
+    pyoxigraph = None  # type: ignore[assignment]
+
+T = TypeVar("T")
+
+
+def source_graph_uri(source_key: str) -> URIRef:
+    """Return the named-graph URI a source is loaded under."""
+    return URIRef(f"urn:graph:{source_key}")
 
 
 def load_source_graph(dataset: Dataset, source_key: str, file_path: Path) -> tuple[Graph, URIRef]:
@@ -14,13 +29,129 @@ def load_source_graph(dataset: Dataset, source_key: str, file_path: Path) -> tup
 
     The graph URI is derived from the source key to provide stable references.
     """
+    triples = read_source_triples(source_key, file_path)
+    graph_uri = source_graph_uri(source_key)
+    graph = dataset.graph(graph_uri)
+    if triples is None:
+        graph.parse(str(file_path), format="ttl")
+    else:
+        graph.addN((subject, predicate, obj, graph) for subject, predicate, obj in triples)
+    return graph, graph_uri
+
+
+def read_source_triples(
+    source_key: str,
+    file_path: Path,
+    collect: Callable[[Iterable[tuple[Node, Node, Node]]], T] = list,  # type: ignore[assignment]
+) -> T | None:
+    """
+    Parse a TTL file with pyoxigraph into rdflib terms.
+
+    The triples are streamed into ``collect`` as they are parsed, so callers
+    that build their own structure never hold the full triple list. Returns
+    None when pyoxigraph is not installed or rejects the file; callers then
+    fall back to rdflib's own parser.
+    """
     if not file_path.exists():
         raise FileNotFoundError(f"TTL file not found for source '{source_key}': {file_path}")
+    if pyoxigraph is None:
+        return None
+    try:
+        return collect(_oxigraph_triples(file_path))
+    except SyntaxError:
+        return None  # rdflib's parser accepts some input oxigraph rejects.
 
-    graph_uri = URIRef(f"urn:graph:{source_key}")
-    graph = dataset.graph(graph_uri)
-    graph.parse(str(file_path), format="ttl")
-    return graph, graph_uri
+
+def load_sparql_store(source_paths: Mapping[str, Path]) -> Any | None:
+    """
+    Load all source TTL files into an in-memory pyoxigraph store for SPARQL.
+
+    Each source becomes the same named graph as in ``load_dataset``. Oxigraph
+    answers typical queries one to two orders of magnitude faster than rdflib's
+    SPARQL engine. Returns None when pyoxigraph is not installed or rejects a
+    file, so callers can query the rdflib dataset instead.
+    """
+    if pyoxigraph is None:
+        return None
+    store = pyoxigraph.Store()
+    for source_key, file_path in source_paths.items():
+        if not file_path.exists():
+            raise FileNotFoundError(f"TTL file not found for source '{source_key}': {file_path}")
+        graph = pyoxigraph.NamedNode(str(source_graph_uri(source_key)))
+        try:
+            store.bulk_extend(
+                pyoxigraph.Quad(quad.subject, quad.predicate, quad.object, graph)
+                for quad in pyoxigraph.parse(path=str(file_path), format=pyoxigraph.RdfFormat.TURTLE, lenient=True)
+            )
+        except SyntaxError:
+            return None
+    return store
+
+
+def query_sparql_store(store: Any, query: str) -> list[tuple[str, ...]]:
+    """
+    Run a SPARQL query on a ``load_sparql_store`` store.
+
+    Queries see the union of all source graphs and may use the prefixes rdflib
+    binds on ``load_dataset``'s dataset without declaring them, as they can there.
+    Each solution (or constructed triple) is returned as the ``str()`` rdflib gives
+    its terms; unbound variables read "None". ASK queries return no rows.
+
+    Raises:
+        SyntaxError: If oxigraph rejects the query (rdflib accepts some it does not).
+    """
+    results = store.query(query, prefixes=_sparql_prefixes(), use_default_graph_as_union=True)
+    if isinstance(results, pyoxigraph.QueryBoolean):
+        return []
+    if isinstance(results, pyoxigraph.QuerySolutions):
+        variables = results.variables
+        return [tuple(_term_text(solution[variable]) for variable in variables) for solution in results]
+    return [(_term_text(t.subject), _term_text(t.predicate), _term_text(t.object)) for t in results]
+
+
+@cache
+def _sparql_prefixes() -> dict[str, str]:
+    dataset = Dataset()
+    bind_common_namespaces(dataset)
+    return {prefix: str(namespace) for prefix, namespace in dataset.namespaces() if prefix}
+
+
+def _term_text(term: Any) -> str:
+    # IRI, blank node id or lexical form, like str() of the rdflib term; None stays "None".
+    return term.value if hasattr(term, "value") else str(term)
+
+
+def _oxigraph_triples(file_path: Path) -> Iterator[tuple[Node, Node, Node]]:
+    """
+    Parse Turtle with pyoxigraph and convert the terms to rdflib nodes.
+
+    Each distinct term is converted once and the rdflib node is shared by every
+    triple that repeats it. Blank node labels map to fresh rdflib blank nodes so
+    separate files never collide.
+    """
+    nodes: dict[Any, Node] = {}
+    xsd_string = str(XSD.string)
+
+    def create(term: Any) -> Node:
+        if isinstance(term, pyoxigraph.NamedNode):
+            return uri_ref(term.value)
+        if isinstance(term, pyoxigraph.BlankNode):
+            return BNode()
+        if term.language:
+            return Literal(term.value, lang=term.language)
+        # rdflib leaves plain literals untyped; oxigraph reports them as xsd:string.
+        if term.datatype.value == xsd_string:
+            return Literal(term.value)
+        return Literal(term.value, datatype=cast(URIRef, convert(term.datatype)))
+
+    def convert(term: Any) -> Node:
+        node = nodes.get(term)
+        if node is None:
+            node = nodes[term] = create(term)
+        return node
+
+    for quad in pyoxigraph.parse(path=str(file_path), format=pyoxigraph.RdfFormat.TURTLE, lenient=True):
+        yield convert(quad.subject), convert(quad.predicate), convert(quad.object)
 
 
 def load_dataset(
@@ -31,8 +162,9 @@ def load_dataset(
 
     Returns the populated dataset, a mutable mapping of ``source_key`` to
     graph objects, and a mapping to the graph URI strings (used in diagnostics).
+    Each source is a named graph; queries without a GRAPH clause see all of them.
     """
-    dataset = Dataset()
+    dataset = Dataset(default_union=True)
     bind_common_namespaces(dataset)
 
     graphs: MutableMapping[str, Graph] = {}
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from typing import Iterable
+import sys
+from itertools import chain
+from pathlib import Path
+from typing import Any, Callable, Iterable, Sequence
 
 from rdflib import Graph
 from rdflib.namespace import RDF
@@ -16,18 +19,27 @@ from ..data_models import (
     literal_to_str,
     literals_to_strings,
 )
+from ..text import keyword_tokens_from_fields
 from .dedupe import resolve_resource_identifier, select_richest
+from .graph import read_source_triples
 from .utils import (
     DCT,
-    collect_literal_strings,
+    AdjacencyCache,
+    EdgeLookup,
+    ObjectLookup,
     first_literal,
+    first_literal_in,
     first_node,
+    first_node_in,
     first_value_as_str,
+    literal_strings,
     literal_to_bool,
     node_to_str,
-    schema_objects,
+    objects_of,
     schema_predicates,
+    shared_uri,
     SCHEMA_NAMESPACES,
+    TripleIndex,
 )
 
 # Resource types supported by the loader; mirrors the original implementation.
@@ -37,143 +49,301 @@ RESOURCE_TYPES = tuple(
     for name in ("Course", "LearningResource", "Event")
 )
 
+# schema.org predicates (HTTP and HTTPS forms) resolved once at import.
+_P_ABOUT = schema_predicates("about")
+_P_ABSTRACT = schema_predicates("abstract")
+_P_ACCESSIBILITY_CONTROL = schema_predicates("accessibilityControl")
+_P_ACCESSIBILITY_FEATURE = schema_predicates("accessibilityFeature")
+_P_ACCESSIBILITY_SUMMARY = schema_predicates("accessibilitySummary")
+_P_ACCESS_MODE = schema_predicates("accessMode")
+_P_ACCESS_MODE_SUFFICIENT = schema_predicates("accessModeSufficient")
+_P_ADDRESS = schema_predicates("address")
+_P_ADDRESS_COUNTRY = schema_predicates("addressCountry")
+_P_ADDRESS_LOCALITY = schema_predicates("addressLocality")
+_P_ALTERNATE_NAME = schema_predicates("alternateName")
+_P_AUDIENCE = schema_predicates("audience")
+_P_AUTHOR = schema_predicates("author")
+_P_CONTRIBUTOR = schema_predicates("contributor")
+_P_COURSE_MODE = schema_predicates("courseMode")
+_P_COURSE_PREREQUISITES = schema_predicates("coursePrerequisites")
+_P_CREATIVE_WORK_STATUS = schema_predicates("creativeWorkStatus")
+_P_DATE_MODIFIED = schema_predicates("dateModified")
+_P_DATE_PUBLISHED = schema_predicates("datePublished")
+_P_DESCRIPTION = schema_predicates("description")
+_P_EDUCATIONAL_LEVEL = schema_predicates("educationalLevel")
+_P_EDUCATIONAL_ROLE = schema_predicates("educationalRole")
+_P_END_DATE = schema_predicates("endDate")
+_P_FUNDER = schema_predicates("funder")
+_P_HAS_COURSE_INSTANCE = schema_predicates("hasCourseInstance")
+_P_HEADLINE = schema_predicates("headline")
+_P_IDENTIFIER = schema_predicates("identifier")
+_P_INTERACTIVITY_TYPE = schema_predicates("interactivityType")
+_P_IN_LANGUAGE = schema_predicates("inLanguage")
+_P_IS_ACCESSIBLE_FOR_FREE = schema_predicates("isAccessibleForFree")
+_P_IS_FAMILY_FRIENDLY = schema_predicates("isFamilyFriendly")
+_P_KEYWORDS = schema_predicates("keywords")
+_P_LATITUDE = schema_predicates("latitude")
+_P_LEARNING_RESOURCE_TYPE = schema_predicates("learningResourceType")
+_P_LEGAL_NAME = schema_predicates("legalName")
+_P_LICENSE = schema_predicates("license")
+_P_LOCATION = schema_predicates("location")
+_P_LONGITUDE = schema_predicates("longitude")
+_P_MAXIMUM_ATTENDEE_CAPACITY = schema_predicates("maximumAttendeeCapacity")
+_P_NAME = schema_predicates("name")
+_P_ORGANIZER = schema_predicates("organizer")
+_P_PERSON_IDENTIFIERS = schema_predicates("identifier", "mainEntityOfPage", "url")
+_P_POSTAL_CODE = schema_predicates("postalCode")
+_P_PROVIDER = schema_predicates("provider")
+_P_START_DATE = schema_predicates("startDate")
+_P_STREET_ADDRESS = schema_predicates("streetAddress")
+_P_TEACHES = schema_predicates("teaches")
+_P_URL = schema_predicates("url")
+_P_VERSION = schema_predicates("version")
+_P_DCT_SUBJECT = shared_uri(DCT.subject)
+# _collect_topics reads schema:about and dct:subject.
+_TOPIC_PREDICATES = (*_P_ABOUT, _P_DCT_SUBJECT)
+
+
+class _OrganizationCache:
+    """
+    Organizations parsed during one extraction pass.
+
+    Providers and organizers are often one shared node, so each node is parsed
+    once. Harvests also repeat the same organization as a fresh blank node per
+    resource; equal organizations share one instance.
+    """
+
+    def __init__(self) -> None:
+        self.by_node: dict[Node, Organization | None] = {}
+        self.by_value: dict[Organization, Organization] = {}
+
 
 def extract_resources_from_graph(graph: Graph, source_key: str) -> dict[str, TrainingResource]:
     """
     Parse a named graph into training resources keyed by their canonical URI.
     """
     resources: dict[str, TrainingResource] = {}
-    seen_subjects: set[Node] = set()
+    lookup = AdjacencyCache(graph)
+    org_cache = _OrganizationCache()
+
+    for subject in _resource_subjects(graph):
+        _add_resource(resources, lookup, subject, source_key, org_cache)
+        # Nested nodes are rarely shared between resources (organizations are
+        # memoized separately), so keep only one resource's edges at a time.
+        lookup.clear()
+
+    return resources
+
 
-    for rdf_type in RESOURCE_TYPES:
-        for subject in graph.subjects(RDF.type, rdf_type):
-            if subject in seen_subjects:
-                continue
-            seen_subjects.add(subject)
+def extract_resources_from_triples(
+    triples: Iterable[tuple[Node, Node, Node]], source_key: str
+) -> dict[str, TrainingResource]:
+    """
+    Extract training resources from one source's triples without an rdflib store.
+    """
+    return _extract_resources_from_index(TripleIndex(triples), source_key)
 
-            resource_id = resolve_resource_identifier(graph, subject)
-            if resource_id is None:
-                continue
 
-            resource = _build_training_resource(graph, subject, source_key, resource_id)
-            select_richest(resources, resource)
+def _extract_resources_from_index(index: TripleIndex, source_key: str) -> dict[str, TrainingResource]:
+    resources: dict[str, TrainingResource] = {}
+    org_cache = _OrganizationCache()
+
+    for subject in _resource_subjects(index):
+        _add_resource(resources, index, subject, source_key, org_cache)
 
     return resources
 
 
-def _build_training_resource(graph: Graph, subject: Node, source_key: str, resource_uri: str) -> TrainingResource:
-    types = frozenset(str(obj) for obj in graph.objects(subject, RDF.type))
-    name = literal_to_str(first_literal(graph, subject, *schema_predicates("name")))
-    description = literal_to_str(first_literal(graph, subject, *schema_predicates("description")))
-    abstract = literal_to_str(first_literal(graph, subject, *schema_predicates("abstract")))
-    headline = literal_to_str(first_literal(graph, subject, *schema_predicates("headline")))
-    url = first_value_as_str(graph, subject, *schema_predicates("url"))
-    provider = _extract_primary_organization(graph, subject, *schema_predicates("provider"))
-    keywords = _collect_keywords(graph, subject)
-    topics = _collect_topics(graph, subject)
-    identifiers = _collect_identifiers(graph, subject)
-    authors = _collect_person_identifiers(graph, subject, *schema_predicates("author"))
-    contributors = _collect_person_identifiers(graph, subject, *schema_predicates("contributor"))
-    prerequisites = literals_to_strings(schema_objects(graph, subject, "coursePrerequisites"))
-    teaches = literals_to_strings(schema_objects(graph, subject, "teaches"))
-    learning_resource_types = collect_literal_strings(graph, subject, *schema_predicates("learningResourceType"))
-    educational_levels = collect_literal_strings(graph, subject, *schema_predicates("educationalLevel"))
-    language = _extract_language_label(graph, subject)
-    interactivity_type = literal_to_str(first_literal(graph, subject, *schema_predicates("interactivityType")))
-    access_modes = collect_literal_strings(graph, subject, *schema_predicates("accessMode"))
-    access_mode_sufficient = collect_literal_strings(graph, subject, *schema_predicates("accessModeSufficient"))
-    accessibility_controls = collect_literal_strings(graph, subject, *schema_predicates("accessibilityControl"))
-    accessibility_features = collect_literal_strings(graph, subject, *schema_predicates("accessibilityFeature"))
-    accessibility_summary = literal_to_str(first_literal(graph, subject, *schema_predicates("accessibilitySummary")))
-    audience_roles = _collect_audience_roles(graph, subject)
-    license_url = first_value_as_str(graph, subject, *schema_predicates("license"))
-    is_accessible_for_free = literal_to_bool(first_literal(graph, subject, *schema_predicates("isAccessibleForFree")))
-    is_family_friendly = literal_to_bool(first_literal(graph, subject, *schema_predicates("isFamilyFriendly")))
-    creative_work_status = literal_to_str(first_literal(graph, subject, *schema_predicates("creativeWorkStatus")))
-    version = literal_to_str(first_literal(graph, subject, *schema_predicates("version")))
-
-    published_dt, published_raw = literal_to_datetime(
-        first_literal(graph, subject, *schema_predicates("datePublished"))
-    )
-    modified_dt, modified_raw = literal_to_datetime(
-        first_literal(graph, subject, *schema_predicates("dateModified"))
-    )
+def _add_resource(
+    resources: dict[str, TrainingResource],
+    lookup: EdgeLookup,
+    subject: Node,
+    source_key: str,
+    org_cache: _OrganizationCache,
+) -> None:
+    resource_id = resolve_resource_identifier(lookup, subject)
+    if resource_id is not None:
+        resource = _build_training_resource(lookup, subject, source_key, resource_id, org_cache)
+        select_richest(resources, resource)
+
 
-    course_instances = _collect_course_instances(graph, subject)
+def _resource_subjects(graph: Graph | TripleIndex) -> Iterable[Node]:
+    """Return each typed resource subject once, grouped in ``RESOURCE_TYPES`` order."""
+    # Probing the store's (predicate, object) index once per type is cheaper than
+    # one scan over every rdf:type edge, most of which point at other classes.
+    typed_subjects = (graph.subjects(RDF.type, rdf_type) for rdf_type in RESOURCE_TYPES)
+    return dict.fromkeys(chain.from_iterable(typed_subjects))
+
+
+def extract_resources_from_file(source_key: str, file_path: Path) -> dict[str, TrainingResource]:
+    """
+    Parse a single TTL file and extract its resources.
+
+    With pyoxigraph the triples are indexed as they stream out of the parser,
+    with no intermediate list or rdflib store; otherwise the file is parsed
+    into a private graph.
+    Only the path crosses the process boundary, so this can run in a worker
+    process without pickling an rdflib graph.
+    """
+    index = read_source_triples(source_key, file_path, TripleIndex)
+    if index is not None:
+        return _extract_resources_from_index(index, source_key)
+    graph = Graph()
+    graph.parse(str(file_path), format="ttl")
+    return extract_resources_from_graph(graph, source_key)
+
+
+def _first_literal_str(objects: Sequence[Node]) -> str | None:
+    for obj in objects:
+        if isinstance(obj, Literal):
+            return literal_to_str(obj)
+    return None
+
+
+def _first_bool(objects: Sequence[Node]) -> bool | None:
+    for obj in objects:
+        if isinstance(obj, Literal):
+            return literal_to_bool(obj)
+    return None
+
+
+def _first_str(objects: Sequence[Node]) -> str | None:
+    return node_to_str(objects[0])
+
+
+def _intern(value: str | None) -> str | None:
+    # Provider and place names repeat across thousands of resources; share one copy.
+    return sys.intern(value) if value is not None else None
+
+
+def _first_shared_str(objects: Sequence[Node]) -> str | None:
+    # For controlled values (licences, statuses) that repeat across resources.
+    return _intern(node_to_str(objects[0]))
+
+
+def _first_shared_literal_str(objects: Sequence[Node]) -> str | None:
+    return _intern(_first_literal_str(objects))
+
+
+# Plain fields read straight off a resource's edges as (field, predicates, reducer).
+# A reducer sees the objects of every predicate variant in order and only runs
+# when there is at least one, so absent fields keep their dataclass defaults.
+_FIELD_READERS: tuple[tuple[str, tuple[URIRef, ...], Callable[..., Any]], ...] = (
+    ("name", _P_NAME, _first_literal_str),
+    ("description", _P_DESCRIPTION, _first_literal_str),
+    ("abstract", _P_ABSTRACT, _first_literal_str),
+    ("headline", _P_HEADLINE, _first_literal_str),
+    ("url", _P_URL, _first_str),
+    ("prerequisites", _P_COURSE_PREREQUISITES, literals_to_strings),
+    ("teaches", _P_TEACHES, literals_to_strings),
+    ("learning_resource_types", _P_LEARNING_RESOURCE_TYPE, literal_strings),
+    ("educational_levels", _P_EDUCATIONAL_LEVEL, literal_strings),
+    ("interactivity_type", _P_INTERACTIVITY_TYPE, _first_literal_str),
+    ("access_modes", _P_ACCESS_MODE, literal_strings),
+    ("access_mode_sufficient", _P_ACCESS_MODE_SUFFICIENT, literal_strings),
+    ("accessibility_controls", _P_ACCESSIBILITY_CONTROL, literal_strings),
+    ("accessibility_features", _P_ACCESSIBILITY_FEATURE, literal_strings),
+    ("accessibility_summary", _P_ACCESSIBILITY_SUMMARY, _first_literal_str),
+    ("license_url", _P_LICENSE, _first_shared_str),
+    ("is_accessible_for_free", _P_IS_ACCESSIBLE_FOR_FREE, _first_bool),
+    ("is_family_friendly", _P_IS_FAMILY_FRIENDLY, _first_bool),
+    ("creative_work_status", _P_CREATIVE_WORK_STATUS, _first_shared_literal_str),
+    ("version", _P_VERSION, _first_literal_str),
+)
+
+
+def _build_training_resource(
+    graph: EdgeLookup,
+    subject: Node,
+    source_key: str,
+    resource_uri: str,
+    org_cache: _OrganizationCache,
+) -> TrainingResource:
+    edges = graph.edges(subject)
+    fields: dict[str, Any] = {}
+    for field_name, predicates, reduce in _FIELD_READERS:
+        objects = [obj for predicate in predicates if predicate in edges for obj in edges[predicate]]
+        if objects:
+            fields[field_name] = reduce(objects)
+
+    # The collectors below walk further nodes. Most resources lack most of these
+    # predicates, so each collector only runs when one is present.
+    present = edges.keys()
+    if not present.isdisjoint(_P_PROVIDER):
+        fields["provider"] = _extract_primary_organization(graph, subject, *_P_PROVIDER, org_cache=org_cache)
+    if not present.isdisjoint(_P_KEYWORDS):
+        fields["keywords"] = _collect_keywords(graph, subject)
+    if not present.isdisjoint(_TOPIC_PREDICATES):
+        fields["topics"] = _collect_topics(graph, subject)
+    if not present.isdisjoint(_P_IDENTIFIER):
+        fields["identifiers"] = _collect_identifiers(graph, subject)
+    if not present.isdisjoint(_P_AUTHOR):
+        fields["authors"] = _collect_person_identifiers(graph, subject, *_P_AUTHOR)
+    if not present.isdisjoint(_P_CONTRIBUTOR):
+        fields["contributors"] = _collect_person_identifiers(graph, subject, *_P_CONTRIBUTOR)
+    if not present.isdisjoint(_P_IN_LANGUAGE):
+        fields["language"] = _intern(_extract_language_label(graph, subject))
+    if not present.isdisjoint(_P_AUDIENCE):
+        fields["audience_roles"] = _collect_audience_roles(graph, subject)
+    if not present.isdisjoint(_P_HAS_COURSE_INSTANCE):
+        fields["course_instances"] = _collect_course_instances(graph, subject, org_cache)
+
+    published_dt, published_raw = literal_to_datetime(first_literal_in(edges, *_P_DATE_PUBLISHED))
+    modified_dt, modified_raw = literal_to_datetime(first_literal_in(edges, *_P_DATE_MODIFIED))
 
     return TrainingResource(
-        uri=resource_uri,
+        uri=sys.intern(resource_uri),
         source=source_key,
-        types=types,
-        name=name,
-        description=description,
-        abstract=abstract,
-        headline=headline,
-        url=url,
-        provider=provider,
-        keywords=keywords,
-        topics=topics,
-        identifiers=identifiers,
-        authors=authors,
-        contributors=contributors,
-        prerequisites=prerequisites,
-        teaches=teaches,
-        learning_resource_types=learning_resource_types,
-        educational_levels=educational_levels,
-        language=language,
-        interactivity_type=interactivity_type,
-        access_modes=access_modes,
-        access_mode_sufficient=access_mode_sufficient,
-        accessibility_controls=accessibility_controls,
-        accessibility_features=accessibility_features,
-        accessibility_summary=accessibility_summary,
-        audience_roles=audience_roles,
-        license_url=license_url,
-        is_accessible_for_free=is_accessible_for_free,
-        is_family_friendly=is_family_friendly,
-        creative_work_status=creative_work_status,
-        version=version,
+        types=frozenset(str(obj) for obj in edges.get(RDF.type, ())),
         date_published=published_dt,
         date_published_raw=published_raw,
         date_modified=modified_dt,
         date_modified_raw=modified_raw,
-        course_instances=course_instances,
+        # Tokenize once here so index builds and snapshots reuse the result.
+        keyword_tokens=keyword_tokens_from_fields(fields),
+        **fields,
     )
 
 
-def _collect_course_instances(graph: Graph, subject: URIRef) -> tuple[CourseInstance, ...]:
+def _collect_course_instances(
+    graph: EdgeLookup, subject: Node, org_cache: _OrganizationCache
+) -> tuple[CourseInstance, ...]:
     instances: list[CourseInstance] = []
-    for instance_node in schema_objects(graph, subject, "hasCourseInstance"):
-        instance = _parse_course_instance(graph, instance_node)
+    for instance_node in objects_of(graph, subject, *_P_HAS_COURSE_INSTANCE):
+        instance = _parse_course_instance(graph, instance_node, org_cache)
         if instance:
             instances.append(instance)
     return tuple(instances)
 
 
-def _parse_course_instance(graph: Graph, node: Node) -> CourseInstance | None:
-    start_dt, start_raw = literal_to_datetime(first_literal(graph, node, *schema_predicates("startDate")))
-    end_dt, end_raw = literal_to_datetime(first_literal(graph, node, *schema_predicates("endDate")))
-    mode = literal_to_str(first_literal(graph, node, *schema_predicates("courseMode")))
-    capacity = literal_to_int(first_literal(graph, node, *schema_predicates("maximumAttendeeCapacity")))
+def _parse_course_instance(
+    graph: EdgeLookup, node: Node, org_cache: _OrganizationCache
+) -> CourseInstance | None:
+    # One edge map per node (instance, location, address); every field below is a dict get.
+    edges = graph.edges(node)
+    start_dt, start_raw = literal_to_datetime(first_literal_in(edges, *_P_START_DATE))
+    end_dt, end_raw = literal_to_datetime(first_literal_in(edges, *_P_END_DATE))
+    mode = literal_to_str(first_literal_in(edges, *_P_COURSE_MODE))
+    capacity = literal_to_int(first_literal_in(edges, *_P_MAXIMUM_ATTENDEE_CAPACITY))
 
     country = locality = postal_code = street_address = None
     latitude = longitude = None
 
-    location_node = first_node(graph, node, *schema_predicates("location"))
+    location_node = first_node_in(edges, *_P_LOCATION)
     if location_node is not None:
-        latitude = literal_to_float(first_literal(graph, location_node, *schema_predicates("latitude")))
-        longitude = literal_to_float(first_literal(graph, location_node, *schema_predicates("longitude")))
-        address_node = first_node(graph, location_node, *schema_predicates("address"))
+        location = graph.edges(location_node)
+        latitude = literal_to_float(first_literal_in(location, *_P_LATITUDE))
+        longitude = literal_to_float(first_literal_in(location, *_P_LONGITUDE))
+        address_node = first_node_in(location, *_P_ADDRESS)
         if address_node is not None:
-            country = literal_to_str(first_literal(graph, address_node, *schema_predicates("addressCountry")))
-            locality = literal_to_str(first_literal(graph, address_node, *schema_predicates("addressLocality")))
-            postal_code = literal_to_str(first_literal(graph, address_node, *schema_predicates("postalCode")))
-            street_address = literal_to_str(
-                first_literal(graph, address_node, *schema_predicates("streetAddress"))
-            )
+            address = graph.edges(address_node)
+            country = _intern(literal_to_str(first_literal_in(address, *_P_ADDRESS_COUNTRY)))
+            locality = _intern(literal_to_str(first_literal_in(address, *_P_ADDRESS_LOCALITY)))
+            postal_code = literal_to_str(first_literal_in(address, *_P_POSTAL_CODE))
+            street_address = literal_to_str(first_literal_in(address, *_P_STREET_ADDRESS))
 
-    funders = _collect_organizations(graph, node, *schema_predicates("funder"))
-    organizers = _collect_organizations(graph, node, *schema_predicates("organizer"))
+    funders = _collect_organizations(graph, node, *_P_FUNDER, org_cache=org_cache)
+    organizers = _collect_organizations(graph, node, *_P_ORGANIZER, org_cache=org_cache)
 
     if not any([start_dt, start_raw, end_dt, end_raw, mode, capacity, country, locality]):
         return None
@@ -196,52 +366,40 @@ def _parse_course_instance(graph: Graph, node: Node) -> CourseInstance | None:
     )
 
 
-def _collect_keywords(graph: Graph, subject: URIRef) -> frozenset[str]:
-    keywords: set[str] = set()
-    for value in schema_objects(graph, subject, "keywords"):
-        text = node_to_str(value)
-        if not text:
-            continue
-        parts = [part.strip() for part in text.replace(";", ",").split(",") if part.strip()]
-        keywords.update(parts)
-    return frozenset(keywords)
+def _collect_keywords(graph: ObjectLookup, subject: Node) -> frozenset[str]:
+    texts = filter(None, map(node_to_str, objects_of(graph, subject, *_P_KEYWORDS)))
+    keywords = {part for text in texts for part in map(str.strip, text.replace(";", ",").split(",")) if part}
+    return frozenset(map(sys.intern, keywords))
 
 
-def _collect_topics(graph: Graph, subject: URIRef) -> frozenset[str]:
+def _collect_topics(graph: ObjectLookup, subject: Node) -> frozenset[str]:
     topics: set[str] = set()
-    for value in schema_objects(graph, subject, "about"):
+    for value in objects_of(graph, subject, *_P_ABOUT):
         for string_value in _topic_strings_from_node(graph, value):
             if string_value:
                 topics.add(string_value)
-    for value in graph.objects(subject, DCT.subject):
-        string_value = node_to_str(value)
-        if string_value:
-            topics.add(string_value)
-    return frozenset(topics)
+    for value in graph.objects(subject, _P_DCT_SUBJECT):
+        topic = node_to_str(value)
+        if topic:
+            topics.add(topic)
+    return frozenset(map(sys.intern, topics))
 
 
-def _collect_identifiers(graph: Graph, subject: URIRef) -> frozenset[str]:
-    identifiers: set[str] = set()
-    for value in schema_objects(graph, subject, "identifier"):
-        string_value = node_to_str(value)
-        if string_value:
-            identifiers.add(string_value)
-    return frozenset(identifiers)
+def _collect_identifiers(graph: ObjectLookup, subject: Node) -> frozenset[str]:
+    return frozenset(filter(None, map(node_to_str, objects_of(graph, subject, *_P_IDENTIFIER))))
 
 
-def _collect_person_identifiers(graph: Graph, subject: Node, *predicates: URIRef) -> tuple[str, ...]:
-    results: list[str] = []
-    seen: set[str] = set()
+def _collect_person_identifiers(graph: ObjectLookup, subject: Node, *predicates: URIRef) -> tuple[str, ...]:
+    seen: dict[str, None] = {}
     for predicate in predicates:
         for node in graph.objects(subject, predicate):
             for identifier in _extract_person_identifiers(graph, node):
-                if identifier and identifier not in seen:
-                    seen.add(identifier)
-                    results.append(identifier)
-    return tuple(results)
+                if identifier:
+                    seen[identifier] = None
+    return tuple(map(sys.intern, seen))
 
 
-def _extract_person_identifiers(graph: Graph, node: Node) -> Iterable[str]:
+def _extract_person_identifiers(graph: ObjectLookup, node: Node) -> Iterable[str]:
     if isinstance(node, Literal):
         value = literal_to_str(node)
         return [value] if value else []
@@ -249,46 +407,62 @@ def _extract_person_identifiers(graph: Graph, node: Node) -> Iterable[str]:
         return [str(node)]
     if isinstance(node, BNode):
         values: list[str] = []
-        for predicate in ("identifier", "mainEntityOfPage", "url"):
-            for value in schema_objects(graph, node, predicate):
-                string_value = node_to_str(value)
-                if string_value:
-                    values.append(string_value)
-        name = literal_to_str(first_literal(graph, node, *schema_predicates("name")))
+        for obj in objects_of(graph, node, *_P_PERSON_IDENTIFIERS):
+            string_value = node_to_str(obj)
+            if string_value:
+                values.append(string_value)
+        name = literal_to_str(first_literal(graph, node, *_P_NAME))
         if name:
             values.append(name)
         return values or [str(node)]
     return []
 
 
-def _extract_primary_organization(graph: Graph, subject: URIRef, *predicates: URIRef) -> Organization | None:
+def _extract_primary_organization(
+    graph: ObjectLookup, subject: Node, *predicates: URIRef, org_cache: _OrganizationCache
+) -> Organization | None:
     for predicate in predicates:
         for node in graph.objects(subject, predicate):
-            organization = _parse_organization(graph, node)
+            organization = _parse_organization(graph, node, org_cache)
             if organization is not None:
                 return organization
     return None
 
 
-def _collect_organizations(graph: Graph, subject: Node, *predicates: URIRef) -> tuple[Organization, ...]:
+def _collect_organizations(
+    graph: ObjectLookup, subject: Node, *predicates: URIRef, org_cache: _OrganizationCache
+) -> tuple[Organization, ...]:
     organizations: list[Organization] = []
     for predicate in predicates:
         for node in graph.objects(subject, predicate):
-            organization = _parse_organization(graph, node)
+            organization = _parse_organization(graph, node, org_cache)
             if organization is not None:
                 organizations.append(organization)
     return tuple(organizations)
 
 
-def _parse_organization(graph: Graph, node: Node) -> Organization | None:
+def _parse_organization(
+    graph: ObjectLookup, node: Node, org_cache: _OrganizationCache
+) -> Organization | None:
+    by_node = org_cache.by_node
+    if node in by_node:
+        return by_node[node]
+    organization = _build_organization(graph, node)
+    if organization is not None:
+        organization = org_cache.by_value.setdefault(organization, organization)
+    by_node[node] = organization
+    return organization
+
+
+def _build_organization(graph: ObjectLookup, node: Node) -> Organization | None:
     name_literal = first_literal(
         graph,
         node,
-        *schema_predicates("name"),
-        *schema_predicates("legalName"),
+        *_P_NAME,
+        *_P_LEGAL_NAME,
     )
     name = literal_to_str(name_literal)
-    url = first_value_as_str(graph, node, *schema_predicates("url"))
+    url = first_value_as_str(graph, node, *_P_URL)
 
     if not name and isinstance(node, URIRef):
         name = str(node)
@@ -298,11 +472,11 @@ def _parse_organization(graph: Graph, node: Node) -> Organization | None:
     if not name:
         return None
 
-    return Organization(name=name, url=url)
+    return Organization(name=sys.intern(name), url=_intern(url))
 
 
-def _extract_language_label(graph: Graph, subject: Node) -> str | None:
-    language_node = first_node(graph, subject, *schema_predicates("inLanguage"))
+def _extract_language_label(graph: ObjectLookup, subject: Node) -> str | None:
+    language_node = first_node(graph, subject, *_P_IN_LANGUAGE)
     if language_node is None:
         return None
     if isinstance(language_node, Literal):
@@ -310,17 +484,17 @@ def _extract_language_label(graph: Graph, subject: Node) -> str | None:
     if isinstance(language_node, URIRef):
         return str(language_node)
     if isinstance(language_node, BNode):
-        alt = literal_to_str(first_literal(graph, language_node, *schema_predicates("alternateName")))
+        alt = literal_to_str(first_literal(graph, language_node, *_P_ALTERNATE_NAME))
         if alt:
             return alt
-        name = literal_to_str(first_literal(graph, language_node, *schema_predicates("name")))
+        name = literal_to_str(first_literal(graph, language_node, *_P_NAME))
         if name:
             return name
         return str(language_node)
     return None
 
 
-def _topic_strings_from_node(graph: Graph, node: Node) -> Iterable[str]:
+def _topic_strings_from_node(graph: ObjectLookup, node: Node) -> Iterable[str]:
     if isinstance(node, Literal):
         value = literal_to_str(node)
         return [value] if value else []
@@ -328,20 +502,20 @@ def _topic_strings_from_node(graph: Graph, node: Node) -> Iterable[str]:
         return [str(node)]
     if isinstance(node, BNode):
         values: list[str] = []
-        name = literal_to_str(first_literal(graph, node, *schema_predicates("name")))
+        name = literal_to_str(first_literal(graph, node, *_P_NAME))
         if name:
             values.append(name)
-        for value in schema_objects(graph, node, "url"):
-            string_value = node_to_str(value)
+        for obj in objects_of(graph, node, *_P_URL):
+            string_value = node_to_str(obj)
             if string_value:
                 values.append(string_value)
         return values or [str(node)]
     return []
 
 
-def _collect_audience_roles(graph: Graph, subject: Node) -> frozenset[str]:
+def _collect_audience_roles(graph: ObjectLookup, subject: Node) -> frozenset[str]:
     roles: set[str] = set()
-    for audience_node in schema_objects(graph, subject, "audience"):
+    for audience_node in objects_of(graph, subject, *_P_AUDIENCE):
         if isinstance(audience_node, Literal):
             value = literal_to_str(audience_node)
             if value:
@@ -351,11 +525,11 @@ def _collect_audience_roles(graph: Graph, subject: Node) -> frozenset[str]:
             roles.add(str(audience_node))
             continue
         if isinstance(audience_node, BNode):
-            for role_literal in schema_objects(graph, audience_node, "educationalRole"):
+            for role_literal in objects_of(graph, audience_node, *_P_EDUCATIONAL_ROLE):
                 value = node_to_str(role_literal)
                 if value:
                     roles.add(value)
-            name = literal_to_str(first_literal(graph, audience_node, *schema_predicates("name")))
+            name = literal_to_str(first_literal(graph, audience_node, *_P_NAME))
             if name:
                 roles.add(name)
-    return frozenset(roles)
+    return frozenset(map(sys.intern, roles))
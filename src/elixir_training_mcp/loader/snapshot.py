@@ -0,0 +1,115 @@
+"""
+On-disk snapshots of extracted training resources and their indexes.
+
+Parsing and extracting the harvested TTL files dominates start-up time, so the
+deduplicated resources, together with the indexes and stats built from them,
+can be pickled once per set of source files and reused on warm starts. Snapshot names are derived from the source paths, their sizes
+and modification times, the package version and the source code of the modules
+that build the payload, so changing any input or any parser/index code produces
+a fresh snapshot instead of a stale hit. Older snapshots of the same source set
+are pruned when a new one is written.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import gc
+import hashlib
+import os
+import pickle
+import tempfile
+from collections.abc import Mapping
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from elixir_training_mcp import __version__
+
+# Bump when the pickled payload layout changes.
+SNAPSHOT_FORMAT = 4
+_SNAPSHOT_PREFIX = "training_store_"
+# Modules whose code determines the pickled resources, indexes and stats.
+_PAYLOAD_MODULES = ("data_models.py", "data_store.py", "indexes/*.py", "loader/*.py")
+
+
+def snapshot_path(cache_dir: Path, source_paths: Mapping[str, Path]) -> Path | None:
+    """
+    Return the snapshot file for the current state of ``source_paths``.
+
+    Returns None when a source cannot be stat'ed, leaving the loader to report it.
+    """
+    sources = sorted((source_key, file_path.resolve()) for source_key, file_path in source_paths.items())
+    source_set = hashlib.sha256(repr(sources).encode())
+    digest = hashlib.sha256(f"{SNAPSHOT_FORMAT}:{__version__}:{_code_fingerprint()}".encode())
+    for source_key, file_path in sources:
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+        digest.update(f"\0{source_key}\0{file_path}\0{stat.st_mtime_ns}\0{stat.st_size}".encode())
+    return cache_dir / f"{_SNAPSHOT_PREFIX}{source_set.hexdigest()[:8]}_{digest.hexdigest()[:16]}.pickle"
+
+
+@cache
+def _code_fingerprint() -> str:
+    # Parser or index fixes change the payload without a version bump; hash their source.
+    package_dir = Path(__file__).resolve().parent.parent
+    digest = hashlib.sha256()
+    for pattern in _PAYLOAD_MODULES:
+        for module_path in sorted(package_dir.glob(pattern)):
+            digest.update(module_path.name.encode())
+            digest.update(module_path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def read_snapshot(path: Path) -> Any | None:
+    """Load a snapshot, returning None when it is missing or unreadable."""
+    # Unpickling allocates hundreds of thousands of objects and nothing in the
+    # payload is garbage, so generational collections during the load are pure
+    # overhead (about half the load time). Pause them and restore the caller's state.
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        with path.open("rb") as handle:
+            # Snapshots are only ever written by write_snapshot into a local cache directory.
+            return pickle.load(handle)  # noqa: S301
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, TypeError, ValueError):
+        # Truncated, corrupt or incompatible payloads are treated as a miss.
+        return None
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def write_snapshot(path: Path, payload: Any) -> None:
+    """
+    Atomically write a snapshot next to its final location and prune older
+    snapshots of the same source set.
+
+    Failures (read-only or full cache directories) are ignored: the snapshot is
+    an optimisation and the caller already holds the freshly built data.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                pickle.dump(payload, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+    except OSError:
+        return
+    _prune_stale_snapshots(path)
+
+
+def _prune_stale_snapshots(path: Path) -> None:
+    # Snapshot names are "<prefix><source set>_<state>.pickle"; keep only the newest state per set.
+    source_set = path.name.rpartition("_")[0]
+    if not source_set.startswith(_SNAPSHOT_PREFIX):
+        return
+    for stale in path.parent.glob(f"{source_set}_*.pickle"):
+        if stale != path:
+            with contextlib.suppress(OSError):
+                stale.unlink()
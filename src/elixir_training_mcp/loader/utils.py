@@ -1,8 +1,12 @@
 from __future__ import annotations
 
-from typing import Iterable, Iterator
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Iterable, Iterator, Mapping, Protocol, Sequence
 
 from rdflib import Dataset, Graph, Namespace
+from rdflib.namespace import RDF
 from rdflib.term import BNode, Literal, Node, URIRef
 
 from ..data_models import literal_to_str
@@ -22,22 +26,152 @@ def bind_common_namespaces(dataset: Dataset) -> None:
     dataset.namespace_manager.bind("dct", DCT, override=False)
 
 
+class ObjectLookup(Protocol):
+    """The slice of the rdflib ``Graph`` API the extraction helpers rely on."""
+
+    def objects(self, subject: Node, predicate: Node) -> Iterable[Node]: ...
+
+
+class EdgeLookup(ObjectLookup, Protocol):
+    """An ``ObjectLookup`` that also hands out all of a subject's edges at once."""
+
+    def edges(self, subject: Node) -> Mapping[Node, Iterable[Node]]: ...
+
+
+_NO_EDGES: Mapping[Node, Iterable[Node]] = MappingProxyType({})
+_RDF_TYPE = frozenset({RDF.type})
+
+
+class AdjacencyCache:
+    """
+    Per-subject ``predicate -> objects`` cache over an rdflib graph.
+
+    A subject's edges are read from the store in one call the first time it is
+    visited, so the many predicate lookups made while building a resource are
+    dict gets. Object order per predicate matches ``Graph.objects``.
+    """
+
+    def __init__(self, graph: Graph) -> None:
+        self._graph = graph
+        self._store = graph.store
+        self._edges: dict[Node, dict[Node, list[Node]]] = {}
+
+    def objects(self, subject: Node, predicate: Node) -> Sequence[Node]:
+        edges = self._edges.get(subject)
+        if edges is None:
+            edges = self.edges(subject)
+        return edges.get(predicate, ())
+
+    def edges(self, subject: Node) -> dict[Node, list[Node]]:
+        """Return the subject's ``predicate -> objects`` map, reading the store on first use."""
+        edges = self._edges.get(subject)
+        if edges is None:
+            edges = {}
+            # Ask the store directly: Graph.predicate_objects only wraps this
+            # call in two more generators. The store still scopes to the graph.
+            for (_, edge_predicate, obj), _ in self._store.triples((subject, None, None), context=self._graph):
+                bucket = edges.get(edge_predicate)
+                if bucket is None:
+                    edges[edge_predicate] = [obj]
+                else:
+                    bucket.append(obj)
+            self._edges[subject] = edges
+        return edges
+
+    def clear(self) -> None:
+        """Drop every cached subject, e.g. once a resource and its nested nodes are built."""
+        self._edges.clear()
+
+
+class TripleIndex:
+    """
+    Subject -> predicate -> objects index built straight from parsed triples.
+
+    Extraction only asks for a subject's objects and for the subjects of each
+    rdf:type, so when the RDF graph itself is not kept this replaces a full
+    rdflib store. As in rdflib's in-memory store, duplicate triples collapse
+    and objects keep their input order.
+    """
+
+    def __init__(self, triples: Iterable[tuple[Node, Node, Node]]) -> None:
+        edges_by_subject: dict[Node, dict[Node, dict[Node, None]]] = {}
+        typed: dict[Node, dict[Node, None]] = {}
+        for subject, predicate, obj in triples:
+            edges = edges_by_subject.get(subject)
+            if edges is None:
+                edges = edges_by_subject[subject] = {}
+            objects = edges.get(predicate)
+            if objects is None:
+                objects = edges[predicate] = {}
+            objects[obj] = None
+            # Set membership compares hashes in C before URIRef.__eq__ runs.
+            if predicate in _RDF_TYPE:
+                typed.setdefault(obj, {})[subject] = None
+        self._edges = edges_by_subject
+        self._typed = typed
+
+    def objects(self, subject: Node, predicate: Node) -> Iterable[Node]:
+        edges = self._edges.get(subject)
+        if edges is None:
+            return ()
+        return edges.get(predicate, ())
+
+    def edges(self, subject: Node) -> Mapping[Node, Iterable[Node]]:
+        return self._edges.get(subject, _NO_EDGES)
+
+    def subjects(self, predicate: Node, obj: Node) -> Iterable[Node]:
+        if predicate == RDF.type:
+            return self._typed.get(obj, ())
+        return [subject for subject, edges in self._edges.items() if obj in edges.get(predicate, ())]
+
+
+# One URIRef instance per predicate extraction asks for. When parsed triples
+# reuse these objects, edge-map lookups match on identity instead of calling
+# rdflib's Python-level ``URIRef.__eq__``.
+_SHARED_URIS: dict[str, URIRef] = {str(RDF.type): RDF.type}
+
+
+def shared_uri(value: str) -> URIRef:
+    """Return the shared ``URIRef`` for ``value``, registering it on first use."""
+    # Key by plain str: URIRef.__eq__ never matches a str, so URIRef keys would
+    # hide entries from uri_ref.
+    key = str(value)
+    uri = _SHARED_URIS.get(key)
+    if uri is None:
+        uri = _SHARED_URIS[key] = URIRef(key)
+    return uri
+
+
+def uri_ref(value: str) -> URIRef:
+    """Return the shared ``URIRef`` when ``value`` is registered, else a new one."""
+    return _SHARED_URIS.get(value) or URIRef(value)
+
+
+@lru_cache(maxsize=256)
 def schema_predicates(*local_names: str) -> tuple[URIRef, ...]:
-    """Return schema.org predicates for every provided local name."""
+    """Return schema.org predicates for every provided local name.
+
+    Cached: ``schema_objects`` asks for the same few names for every resource.
+    """
     predicates: list[URIRef] = []
     for name in local_names:
         for namespace in SCHEMA_NAMESPACES:
-            predicates.append(namespace[name])
+            predicates.append(shared_uri(namespace[name]))
     return tuple(predicates)
 
 
-def schema_objects(graph: Graph, subject: Node, local_name: str) -> Iterator[Node]:
+def schema_objects(graph: ObjectLookup, subject: Node, local_name: str) -> Iterator[Node]:
     """Yield objects for the given schema.org predicate."""
-    for predicate in schema_predicates(local_name):
+    return objects_of(graph, subject, *schema_predicates(local_name))
+
+
+def objects_of(graph: ObjectLookup, subject: Node, *predicates: URIRef) -> Iterator[Node]:
+    """Yield objects for every supplied predicate, in predicate order."""
+    for predicate in predicates:
         yield from graph.objects(subject, predicate)
 
 
-def first_literal(graph: Graph, subject: Node, *predicates: URIRef) -> Literal | None:
+def first_literal(graph: ObjectLookup, subject: Node, *predicates: URIRef) -> Literal | None:
     """Return the first literal matching any of the supplied predicates."""
     for predicate in predicates:
         for obj in graph.objects(subject, predicate):
@@ -46,7 +180,7 @@ def first_literal(graph: Graph, subject: Node, *predicates: URIRef) -> Literal |
     return None
 
 
-def first_node(graph: Graph, subject: Node, *predicates: URIRef) -> Node | None:
+def first_node(graph: ObjectLookup, subject: Node, *predicates: URIRef) -> Node | None:
     """Return the first RDF node matching any of the supplied predicates."""
     for predicate in predicates:
         for obj in graph.objects(subject, predicate):
@@ -54,6 +188,23 @@ def first_node(graph: Graph, subject: Node, *predicates: URIRef) -> Node | None:
     return None
 
 
+def first_literal_in(edges: Mapping[Node, Iterable[Node]], *predicates: URIRef) -> Literal | None:
+    """Like ``first_literal``, over a subject's already fetched ``EdgeLookup.edges`` map."""
+    for predicate in predicates:
+        for obj in edges.get(predicate, ()):
+            if isinstance(obj, Literal):
+                return obj
+    return None
+
+
+def first_node_in(edges: Mapping[Node, Iterable[Node]], *predicates: URIRef) -> Node | None:
+    """Like ``first_node``, over a subject's already fetched ``EdgeLookup.edges`` map."""
+    for predicate in predicates:
+        for obj in edges.get(predicate, ()):
+            return obj
+    return None
+
+
 def node_to_str(node: Node) -> str | None:
     """Convert an RDF node to a string representation when possible."""
     if isinstance(node, Literal):
@@ -63,7 +214,7 @@ def node_to_str(node: Node) -> str | None:
     return None
 
 
-def first_value_as_str(graph: Graph, subject: Node, *predicates: URIRef) -> str | None:
+def first_value_as_str(graph: ObjectLookup, subject: Node, *predicates: URIRef) -> str | None:
     """Return the first object for predicates converted to a string."""
     for predicate in predicates:
         for obj in graph.objects(subject, predicate):
@@ -71,15 +222,20 @@ def first_value_as_str(graph: Graph, subject: Node, *predicates: URIRef) -> str
     return None
 
 
-def collect_literal_strings(graph: Graph, subject: URIRef, *predicates: URIRef) -> frozenset[str]:
+def collect_literal_strings(graph: ObjectLookup, subject: Node, *predicates: URIRef) -> frozenset[str]:
     """Collect literal objects for predicates as a frozen set of strings."""
+    return literal_strings(obj for predicate in predicates for obj in graph.objects(subject, predicate))
+
+
+def literal_strings(objects: Iterable[Node]) -> frozenset[str]:
+    """Convert RDF objects into a frozen set of their non-empty string values."""
     values: set[str] = set()
-    for predicate in predicates:
-        for literal in graph.objects(subject, predicate):
-            string_value = literal_to_str(literal) if isinstance(literal, Literal) else node_to_str(literal)
-            if string_value:
-                values.add(string_value)
-    return frozenset(values)
+    for obj in objects:
+        string_value = literal_to_str(obj) if isinstance(obj, Literal) else node_to_str(obj)
+        if string_value:
+            values.add(string_value)
+    # Controlled vocabularies repeat across resources; share one copy of each value.
+    return frozenset(map(sys.intern, values))
 
 
 def literal_to_bool(value: Literal | None) -> bool | None:
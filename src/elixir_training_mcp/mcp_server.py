@@ -1,4 +1,9 @@
 import argparse
+import asyncio
+import gc
+import json
+import time
+from collections import OrderedDict
 from datetime import date
 from typing import Any, Optional
 from importlib.resources import files
@@ -6,7 +11,6 @@ from urllib.parse import quote
 
 import httpx
 from mcp.server.fastmcp import FastMCP
-from rdflib import Dataset
 
 from elixir_training_mcp.models import TessTrainingMaterial
 from elixir_training_mcp.services import get_training_data_service
@@ -20,6 +24,57 @@ mcp = FastMCP(
     json_response=True,
 )
 
+# One client per process so TeSS searches reuse pooled connections instead of a new TLS handshake per call
+_TESS_BASE_URL = "https://tess.elixir-europe.org"
+_tess_client: httpx.AsyncClient | None = None
+
+
+def _get_tess_client() -> httpx.AsyncClient:
+    global _tess_client  # pylint: disable=global-statement
+    if _tess_client is None or _tess_client.is_closed:
+        _tess_client = httpx.AsyncClient()
+    return _tess_client
+
+
+# Agents often repeat a search within a conversation; answer those from memory for a few minutes.
+# Raw response bodies are cached and decoded per call, so callers never share one mutable result.
+_TESS_CACHE_SIZE = 512
+_TESS_CACHE_TTL_S = 300.0
+_tess_cache: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+# Concurrent misses for the same query wait on one request instead of each hitting TeSS.
+_tess_pending: dict[str, asyncio.Task[bytes]] = {}
+
+
+async def _tess_fetch(query: str) -> Any:
+    """Fetch TeSS materials for an already-quoted query, through a bounded LRU cache with expiry."""
+    cached = _tess_cache.get(query)
+    if cached is not None and cached[0] > time.monotonic():
+        _tess_cache.move_to_end(query)
+        body = cached[1]
+    else:
+        pending = _tess_pending.get(query)
+        if pending is None:
+            pending = _tess_pending[query] = asyncio.ensure_future(_tess_download(query))
+            pending.add_done_callback(lambda _: _tess_pending.pop(query, None))
+        # Shielded so one cancelled caller does not cancel the request others are waiting on.
+        body = await asyncio.shield(pending)
+    return json.loads(body)
+
+
+async def _tess_download(query: str) -> bytes:
+    response = await _get_tess_client().get(
+        f"{_TESS_BASE_URL}/materials?q={query}",
+        headers={"accept": "application/json"},
+    )
+    response.raise_for_status()
+    body = response.content
+    _tess_cache[query] = (time.monotonic() + _TESS_CACHE_TTL_S, body)
+    _tess_cache.move_to_end(query)
+    if len(_tess_cache) > _TESS_CACHE_SIZE:
+        _tess_cache.popitem(last=False)
+    return body
+
+
 # https://tess.elixir-europe.org/materials?q=python+data+science
 # TeSS API docs: https://tess.elixir-europe.org/api/json_api#tag/materials
 # Find training materials about data science with python
@@ -47,13 +102,7 @@ async def search_training_materials(
     Returns:
         List of training materials
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"https://tess.elixir-europe.org/materials?q={quote(search)}",
-            headers={"accept": "application/json"},
-        )
-        response.raise_for_status()
-        return response.json()
+    return await _tess_fetch(quote(search))
 
 
 @mcp.tool()
@@ -123,13 +172,6 @@ async def get_sparql_docs() -> str:
     return content
 
 
-g = Dataset(default_union=True)
-with files("elixir_training_mcp").joinpath("data/tess_harvest.ttl").open("rb") as f:
-    g.parse(f, format="ttl")
-with files("elixir_training_mcp").joinpath("data/gtn_harvest.ttl").open("rb") as f:
-    g.parse(f, format="ttl")
-
-
 @mcp.tool()
 async def execute_sparql_query(sparql_query: str) -> str:
     """Formulate and execute a SPARQL query to answer complex questions that can't be handled by other search tools.
@@ -141,17 +183,11 @@ async def execute_sparql_query(sparql_query: str) -> str:
 
     Returns:
         The SPARQL query results in string format."""
-    results = g.query(sparql_query)
-
-    # Format results as a string
-    output_lines = []
-    for row in results:
-        if isinstance(row, bool):
-            continue
-        row_str = ", ".join(str(item) for item in row)
-        output_lines.append(row_str)
+    # Same sources as the search indexes, parsed on the first query rather than at import.
+    rows = get_training_data_service().sparql_rows(sparql_query)
 
-    return "\n".join(output_lines)
+    # Format results as a string, one comma-separated line per row
+    return "\n".join(", ".join(row) for row in rows)
 
 
 def cli() -> None:
@@ -161,9 +197,20 @@ def cli() -> None:
     )
     parser.add_argument("--http", action="store_true", help="Use Streamable HTTP transport")
     parser.add_argument("--port", type=int, default=8888, help="Port to run the server on")
+    parser.add_argument(
+        "--freeze-gc",
+        action="store_true",
+        help="Load the training data at start-up and exempt it from garbage collection (faster large searches)",
+    )
     # parser.add_argument("settings_filepath", type=str, nargs="?", default="sparql-mcp.json", help="Path to settings file")
     args = parser.parse_args()
     # settings = Settings.from_file(args.settings_filepath)
+    if args.freeze_gc:
+        # Full collections otherwise rescan the long-lived store on every large search.
+        # Collect first so no leftover load garbage is frozen with it.
+        get_training_data_service()
+        gc.collect()
+        gc.freeze()
     if args.http:
         mcp.settings.port = args.port
         mcp.settings.log_level = "INFO"
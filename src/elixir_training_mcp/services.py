@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+import threading
 from importlib.resources import files
 from pathlib import Path
 
@@ -9,15 +11,29 @@ from elixir_training_mcp import data_store
 from elixir_training_mcp.tools import TrainingDataService
 
 _service_instance: TrainingDataService | None = None
+# Loading parses every source, so concurrent first calls must wait for one load rather than each run it.
+_service_lock = threading.Lock()
+# Extracted resources are snapshotted here so warm starts skip RDF extraction.
+# ELIXIR_MCP_CACHE_DIR overrides the location; ELIXIR_MCP_NO_CACHE=1 disables snapshots.
+_CACHE_DIR = Path.home() / ".cache" / "elixir_training_mcp"
 # _DATA_DIR = Path(__file__).resolve().parent.parent.parent / "data"
 
 
 def get_training_data_service() -> TrainingDataService:
     global _service_instance  # pylint: disable=global-statement
     if _service_instance is None:
-        store = data_store.load_training_data({
-            "tess": Path(str(files("elixir_training_mcp").joinpath("data/tess_harvest.ttl"))),
-            "gtn": Path(str(files("elixir_training_mcp").joinpath("data/gtn_harvest.ttl"))),
-        })
-        _service_instance = TrainingDataService(store)
+        with _service_lock:
+            if _service_instance is None:
+                store = data_store.load_training_data({
+                    "tess": Path(str(files("elixir_training_mcp").joinpath("data/tess_harvest.ttl"))),
+                    "gtn": Path(str(files("elixir_training_mcp").joinpath("data/gtn_harvest.ttl"))),
+                }, cache_dir=_snapshot_cache_dir())
+                _service_instance = TrainingDataService(store)
     return _service_instance
+
+
+def _snapshot_cache_dir() -> Path | None:
+    if os.environ.get("ELIXIR_MCP_NO_CACHE", "").strip().lower() in {"1", "true", "yes"}:
+        return None
+    override = os.environ.get("ELIXIR_MCP_CACHE_DIR")
+    return Path(override).expanduser() if override else _CACHE_DIR
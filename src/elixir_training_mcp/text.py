@@ -0,0 +1,63 @@
+"""
+Text tokenization shared by the loader and the keyword index.
+
+Resources are tokenized once at parse time and queries are tokenized at lookup
+time; both go through ``tokenize`` so their tokens always agree.
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+from collections.abc import Mapping
+from typing import Any
+
+from .data_models import TrainingResource
+
+TOKEN_PATTERN = re.compile(r"[A-Za-z0-9]+")
+
+# ASCII translation table mapping every non-alphanumeric character to a space
+# and uppercase letters to lowercase, so tokens matching ``TOKEN_PATTERN`` can be
+# produced with C-level translate + split. The bytes variant also blanks 128-255.
+_ASCII_TOKEN_TABLE = "".join(
+    chr(code).lower() if chr(code).isascii() and chr(code).isalnum() else " " for code in range(128)
+)
+_BYTES_TOKEN_TABLE = (_ASCII_TOKEN_TABLE + " " * 128).encode("ascii")
+
+# Resource fields whose text feeds keyword search: single strings, then collections.
+_KEYWORD_TEXT_FIELDS = ("name", "description", "abstract", "headline", "interactivity_type", "language")
+_KEYWORD_COLLECTION_FIELDS = ("keywords", "learning_resource_types", "educational_levels", "prerequisites", "teaches")
+
+
+def tokenize(text: str | None) -> list[str]:
+    """Normalize text to lowercase tokens."""
+    if not text:
+        return []
+    if text.isascii():
+        return text.translate(_ASCII_TOKEN_TABLE).split()
+    # Only U+0130 and the Kelvin sign lowercase onto ASCII letters; texts without
+    # them skip the full-string lower() since the table already folds ASCII case.
+    # Every remaining non-ASCII code point becomes a "?" separator, exactly as
+    # ``TOKEN_PATTERN.findall`` would skip it.
+    if "\u0130" in text or "\u212a" in text:
+        text = text.lower()
+    return text.encode("ascii", "replace").translate(_BYTES_TOKEN_TABLE).decode("ascii").split()
+
+
+def keyword_tokens_from_fields(fields: Mapping[str, Any]) -> frozenset[str]:
+    """Return the distinct search tokens drawn from ``TrainingResource`` field values."""
+    texts: list[str] = [fields[name] for name in _KEYWORD_TEXT_FIELDS if fields.get(name)]
+    for name in _KEYWORD_COLLECTION_FIELDS:
+        texts.extend(fields.get(name, ()))
+
+    # The separator is never part of a token, so tokenizing the joined text in
+    # one call yields the same tokens as tokenizing each field separately.
+    # Interning shares each distinct token across every resource's set.
+    return frozenset(map(sys.intern, tokenize(" ".join(texts))))
+
+
+def collect_keyword_tokens(resource: TrainingResource) -> frozenset[str]:
+    """Return the distinct search tokens drawn from a resource's text fields."""
+    return keyword_tokens_from_fields(
+        {name: getattr(resource, name) for name in (*_KEYWORD_TEXT_FIELDS, *_KEYWORD_COLLECTION_FIELDS)}
+    )
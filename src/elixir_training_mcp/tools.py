@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Any, Mapping
+from typing import Any, Iterable, Mapping
+
+from rdflib import Dataset
 
 from elixir_training_mcp import data_store
+from elixir_training_mcp.loader import query_sparql_store
 
 
 class TrainingDataService:
@@ -17,17 +20,31 @@ class TrainingDataService:
     def stats(self) -> Mapping[str, Any]:
         return self._store.stats
 
+    @property
+    def dataset(self) -> Dataset:
+        return self._store.dataset
+
+    def sparql_rows(self, query: str) -> list[tuple[str, ...]]:
+        """Run a SPARQL query and return each result row as the string values of its terms."""
+        store = self._store.sparql_store
+        if store is not None:
+            try:
+                return query_sparql_store(store, query)
+            except SyntaxError:
+                pass  # rdflib also accepts some non-standard queries, e.g. ungrouped projections
+        return [tuple(map(str, row)) for row in self._store.dataset.query(query) if not isinstance(row, bool)]
+
     def search_by_keyword(self, query: str, limit: int | None = None) -> list[dict[str, Any]]:
         uris = self._store.keyword_index.lookup(query, limit=limit)
-        return [self._resource_to_dict(uri) for uri in uris]
+        return self._resources_to_dicts(uris)
 
     def search_by_provider(self, provider: str, limit: int | None = None) -> list[dict[str, Any]]:
-        uris = self._store.provider_index.lookup(provider, limit=limit)
-        return [self._resource_to_dict(uri) for uri in uris]
+        uris = self._store.provider_index.lookup_iter(provider, limit=limit)
+        return self._resources_to_dicts(uris)
 
     def search_by_location(self, country: str, city: str | None = None, limit: int | None = None) -> list[dict[str, Any]]:
-        uris = self._store.location_index.lookup(country=country, city=city, limit=limit)
-        return [self._resource_to_dict(uri) for uri in uris]
+        uris = self._store.location_index.lookup_iter(country=country, city=city, limit=limit)
+        return self._resources_to_dicts(uris)
 
     def search_by_date_range(
         self,
@@ -36,14 +53,18 @@ class TrainingDataService:
         limit: int | None = None,
     ) -> list[dict[str, Any]]:
         uris = self._store.date_index.lookup(start=start, end=end, limit=limit)
-        return [self._resource_to_dict(uri) for uri in uris]
+        return self._resources_to_dicts(uris)
 
     def search_by_topic(self, topic: str, limit: int | None = None) -> list[dict[str, Any]]:
-        uris = self._store.topic_index.lookup(topic, limit=limit)
-        return [self._resource_to_dict(uri) for uri in uris]
+        uris = self._store.topic_index.lookup_iter(topic, limit=limit)
+        return self._resources_to_dicts(uris)
+
+    def _resources_to_dicts(self, uris: Iterable[str]) -> list[dict[str, Any]]:
+        # Resolve the store mapping once per search rather than once per result.
+        resources = self._store.resources_by_uri
+        return [self._resource_to_dict(resources[uri]) for uri in uris]
 
-    def _resource_to_dict(self, uri: str) -> dict[str, Any]:
-        resource = self._store.resources_by_uri[uri]
+    def _resource_to_dict(self, resource: data_store.TrainingResource) -> dict[str, Any]:
         return {
             "uri": resource.uri,
             "source": resource.source,
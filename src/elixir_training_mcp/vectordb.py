@@ -17,6 +17,11 @@
 # # Load and index training materials at startup
 # def initialize_search_index() -> None:
 #     """Load TTL files, extract materials via SPARQL, and index them in Qdrant."""
+#     # The collection persists in data/qdrant, so later starts reuse it instead of
+#     # re-embedding everything; delete that directory to rebuild after a new harvest.
+#     if qdrant_client.collection_exists(COLLECTION_NAME) and qdrant_client.count(COLLECTION_NAME).count > 0:
+#         return
+
 #     # g = Dataset(default_union=True)
 
 #     # # Load both TTL files
@@ -26,6 +31,9 @@
 #     # with files("elixir_training_mcp").joinpath("data/gtn_harvest.ttl").open("rb") as f:
 #     #     g.parse(f, format="ttl")
 
+#     # When reviving this, prefer building rows from data_store.load_training_data(...).resources_by_uri:
+#     # that extraction reads each source in one flat triple scan and is snapshotted, while this
+#     # query runs a chain of OPTIONAL joins through rdflib's Python query engine.
 #     # SPARQL query to get all training materials with relevant fields
 #     query = """PREFIX schema: <http://schema.org/>
 #     PREFIX dct: <http://purl.org/dc/terms/>
@@ -64,8 +72,8 @@
 #         vectors_config=VectorParams(size=vector_size, distance=Distance.COSINE),
 #     )
 
-#     # Prepare documents for indexing
-#     points = []
+#     # Prepare documents for indexing; embeddings are computed in one batched pass below
+#     rows: list[tuple[int, str, dict[str, Any]]] = []
 #     for idx, row in enumerate(results):
 #         if isinstance(row, bool):
 #             continue
@@ -100,15 +108,11 @@
 #         if material.teaches:
 #             search_text += f" {material.teaches}"
 
-#         # Generate embedding
-#         embedding = next(iter(embedding_model.embed([search_text]))).tolist()
-
-#         # Prepare payload with all metadata
+#         # Prepare payload with all metadata; search_text is only embedded, not stored
 #         payload: dict[str, Any] = {
 #             "course_id": material.course,
 #             "name": material.name,
 #             "description": material.description,
-#             "search_text": search_text,
 #         }
 #         # Add optional fields to payload
 #         if material.provider:
@@ -130,17 +134,17 @@
 #         if material.mode:
 #             payload["mode"] = material.mode
 
-#         points.append(
-#             PointStruct(
-#                 id=idx,
-#                 vector=embedding,
-#                 payload=payload,
-#             )
-#         )
-
-#     # Index all points in Qdrant
-#     if points:
-#         qdrant_client.upsert(collection_name=COLLECTION_NAME, points=points)
+#         rows.append((idx, search_text, payload))
+
+#     # Embed all texts in batches (one forward pass per batch instead of per row),
+#     # then upsert in chunks to bound memory
+#     embeddings = embedding_model.embed([search_text for _, search_text, _ in rows], batch_size=64)
+#     points = [
+#         PointStruct(id=idx, vector=embedding.tolist(), payload=payload)
+#         for (idx, _, payload), embedding in zip(rows, embeddings)
+#     ]
+#     for start in range(0, len(points), 512):
+#         qdrant_client.upsert(collection_name=COLLECTION_NAME, points=points[start:start + 512])
 
 #     print(f"Indexed {len(points)} training materials in Qdrant")
 
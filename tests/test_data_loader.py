@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import gc
+import os
 from datetime import date
 from pathlib import Path
 
@@ -25,9 +27,14 @@ def _skip_if_loader_missing():
     return module
 
 
-def test_loader_parses_sample_resources(sample_sources: dict[str, Path]) -> None:
-    module = _skip_if_loader_missing()
-    store = module.load_training_data(sample_sources)
+@pytest.fixture(scope="session")
+def loaded_store(sample_sources: dict[str, Path]):
+    """One parse of the fixtures, shared by tests that only read the store."""
+    return _skip_if_loader_missing().load_training_data(sample_sources)
+
+
+def test_loader_parses_sample_resources(loaded_store) -> None:
+    store = loaded_store
     assert "loaded_at" in store.stats
     assert store.stats["total_resources"] == 4
     assert store.stats["per_source"]["tess"] == 3
@@ -95,9 +102,8 @@ def test_loader_raises_on_missing_file(tmp_path: Path) -> None:
         module.load_training_data({"missing": missing_path})
 
 
-def test_keyword_index_returns_expected_resources(sample_sources: dict[str, Path]) -> None:
-    module = _skip_if_loader_missing()
-    store = module.load_training_data(sample_sources)
+def test_keyword_index_returns_expected_resources(loaded_store) -> None:
+    store = loaded_store
     result_ids = store.keyword_index.lookup("FAIR metadata")
     tess_material_uri = "https://tess.example.org/materials/python-fair-data"
     gtn_canonical_uri = (
@@ -107,11 +113,12 @@ def test_keyword_index_returns_expected_resources(sample_sources: dict[str, Path
     assert gtn_canonical_uri in result_ids, "Expected FAIR tutorial from GTN in keyword index."
     limited = store.keyword_index.lookup("FAIR metadata", limit=1)
     assert len(limited) == 1
+    assert "fair" in store.tokens_by_uri[tess_material_uri]
+    assert store.resources_by_uri[tess_material_uri].keyword_tokens == store.tokens_by_uri[tess_material_uri]
 
 
-def test_provider_location_topic_and_date_indexes(sample_sources: dict[str, Path]) -> None:
-    module = _skip_if_loader_missing()
-    store = module.load_training_data(sample_sources)
+def test_provider_location_topic_and_date_indexes(loaded_store) -> None:
+    store = loaded_store
 
     tess_material_uri = "https://tess.example.org/materials/python-fair-data"
     provider_expected = [tess_material_uri]
@@ -141,3 +148,90 @@ def test_provider_location_topic_and_date_indexes(sample_sources: dict[str, Path
     ]
     overlap_results = store.date_index.lookup(date(2025, 1, 15), date(2025, 1, 16))
     assert overlap_results == ["https://tess.example.org/courses/winter-metagenomics"]
+
+
+def test_loader_reuses_snapshot_from_cache_dir(sample_sources: dict[str, Path], tmp_path: Path) -> None:
+    module = _skip_if_loader_missing()
+    first = module.load_training_data(sample_sources, cache_dir=tmp_path)
+    snapshots = list(tmp_path.glob("training_store_*.pickle"))
+    assert len(snapshots) == 1
+
+    second = module.load_training_data(sample_sources, cache_dir=tmp_path)
+    assert second._dataset is None, "Snapshot loads should not parse the TTL sources."
+    assert len(second.dataset) == len(first.dataset)
+    assert dict(second.resources_by_uri) == dict(first.resources_by_uri)
+    assert dict(second.per_source_counts) == dict(first.per_source_counts)
+    assert second.keyword_index.lookup("FAIR metadata") == first.keyword_index.lookup("FAIR metadata")
+    assert second.date_index == first.date_index
+    assert dict(second.tokens_by_uri) == dict(first.tokens_by_uri)
+    assert second.stats["loaded_at"] == second.load_timestamp.isoformat()
+    assert {**second.stats, "loaded_at": None} == {**first.stats, "loaded_at": None}
+
+
+def test_snapshots_follow_sources_and_code(sample_sources: dict[str, Path], tmp_path: Path, monkeypatch) -> None:
+    module = _skip_if_loader_missing()
+    snapshot = pytest.importorskip("elixir_training_mcp.loader.snapshot")
+    sources = {key: tmp_path / path.name for key, path in sample_sources.items()}
+    for key, path in sources.items():
+        path.write_bytes(sample_sources[key].read_bytes())
+    cache_dir = tmp_path / "cache"
+
+    module.load_training_data(sources, cache_dir=cache_dir)
+    first = snapshot.snapshot_path(cache_dir, sources)
+    os.utime(sources["gtn"], ns=(0, 0))
+    module.load_training_data(sources, cache_dir=cache_dir)
+    second = snapshot.snapshot_path(cache_dir, sources)
+    assert first != second
+    assert list(cache_dir.glob("training_store_*.pickle")) == [second], "Stale snapshots should be pruned."
+
+    # A parser or index change must not be served from an old snapshot.
+    monkeypatch.setattr(snapshot, "_code_fingerprint", lambda: "changed")
+    assert snapshot.snapshot_path(cache_dir, sources) != second
+
+    # Incompatible payloads are a miss, and a missing source is still the loader's error.
+    monkeypatch.undo()
+    snapshot.write_snapshot(second, ("not", "a", "store"))
+    assert module.load_training_data(sources, cache_dir=cache_dir).resource_count == 4
+    with pytest.raises(FileNotFoundError, match="TTL file not found"):
+        module.load_training_data({"missing": tmp_path / "missing.ttl"}, cache_dir=cache_dir)
+
+
+def test_read_snapshot_restores_garbage_collection(tmp_path: Path) -> None:
+    snapshot = pytest.importorskip("elixir_training_mcp.loader.snapshot")
+    path = tmp_path / "payload.pickle"
+    snapshot.write_snapshot(path, {"resources": [1, 2, 3]})
+
+    assert gc.isenabled()
+    assert snapshot.read_snapshot(path) == {"resources": [1, 2, 3]}
+    assert snapshot.read_snapshot(tmp_path / "missing.pickle") is None
+    assert gc.isenabled()
+
+
+def test_parallel_extraction_matches_serial(sample_sources: dict[str, Path]) -> None:
+    module = _skip_if_loader_missing()
+    serial = module.load_training_data(sample_sources, max_workers=1)
+    parallel = module.load_training_data(sample_sources, max_workers=2)
+    assert dict(parallel.resources_by_uri) == dict(serial.resources_by_uri)
+    assert list(parallel.resources_by_uri) == list(serial.resources_by_uri)
+    assert dict(parallel.per_source_counts) == dict(serial.per_source_counts)
+    # Token slots follow per-process set order, so compare postings, not layout.
+    for token in serial.keyword_index._token_slots:
+        assert parallel.keyword_index.lookup(token) == serial.keyword_index.lookup(token)
+    assert parallel.date_index == serial.date_index
+
+    # Neither path keeps an RDF dataset; the named graphs are parsed on first use.
+    assert serial._dataset is None and parallel._dataset is None
+    graph_sizes = {str(graph.identifier): len(graph) for graph in serial.dataset.graphs()}
+    assert {str(graph.identifier): len(graph) for graph in parallel.dataset.graphs()} == graph_sizes
+
+    serial.release_dataset()
+    assert serial._dataset is None
+    assert {str(graph.identifier): len(graph) for graph in serial.dataset.graphs()} == graph_sizes
+
+
+def test_dataset_queries_see_every_source_graph(sample_sources: dict[str, Path]) -> None:
+    module = _skip_if_loader_missing()
+    store = module.load_training_data(sample_sources, max_workers=1)
+    rows = store.dataset.query("SELECT (COUNT(*) AS ?n) WHERE { ?s ?p ?o }")
+    assert [int(row[0]) for row in rows] == [len(store.dataset)]
+    assert len(store.dataset) > 0
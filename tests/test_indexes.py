@@ -1,15 +1,28 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import gc
+import pickle
+import random
+from datetime import date, datetime, timedelta, timezone
 
 from elixir_training_mcp.data_models import CourseInstance, Organization, TrainingResource
+from elixir_training_mcp.data_store import _build_indexes_and_stats
 from elixir_training_mcp.indexes import (
     DateIndex,
+    DateIndexBuilder,
     KeywordIndex,
     LocationIndex,
     ProviderIndex,
     TopicIndex,
+    collect_keyword_tokens,
 )
+from elixir_training_mcp.indexes.utils import (
+    _LOOKUP_CACHES,
+    input_to_epoch_micros,
+    normalize_datetime_input,
+    to_epoch_micros,
+)
+from elixir_training_mcp.text import tokenize
 
 
 def _sample_resources() -> dict[str, TrainingResource]:
@@ -62,6 +75,17 @@ def test_keyword_index_collects_tokens() -> None:
     index = KeywordIndex.from_resources(_sample_resources())
     results = index.lookup("fair data")
     assert "https://example.org/resources/a" in results
+    assert index.lookup("fair") == ["https://example.org/resources/a"]
+    assert index.lookup("nonexistent") == []
+
+
+def test_keyword_index_packs_postings_as_integer_ids() -> None:
+    resources = _sample_resources()
+    index = KeywordIndex.from_resources(resources)
+    assert index._uris == tuple(resources)
+    assert index._postings.typecode == index._offsets.typecode == "I"
+    assert len(index._offsets) == len(index._token_slots) + 1
+    assert index.lookup("metagenomics fair") == list(reversed(resources))
 
 
 def test_provider_index_normalizes_names() -> None:
@@ -76,6 +100,13 @@ def test_location_index_handles_city_and_country() -> None:
     assert "https://example.org/resources/b" in index.lookup("france")
 
 
+def test_bucket_indexes_normalize_queries_like_keys() -> None:
+    resources = _sample_resources()
+    assert ProviderIndex.from_resources(resources).lookup("  Bioinformatics.CA ") == ["https://example.org/resources/a"]
+    assert LocationIndex.from_resources(resources).lookup(" CANADA", " Toronto ") == ["https://example.org/resources/a"]
+    assert TopicIndex.from_resources(resources).lookup(" Topic_1234 ") == ["https://example.org/resources/b"]
+
+
 def test_date_index_filters_by_range() -> None:
     index = DateIndex.from_resources(_sample_resources())
     results = index.lookup(datetime(2025, 1, 1, tzinfo=timezone.utc), datetime(2025, 1, 31, tzinfo=timezone.utc))
@@ -86,3 +117,175 @@ def test_topic_index_matches_short_names() -> None:
     index = TopicIndex.from_resources(_sample_resources())
     assert index.lookup("topic_3391") == ["https://example.org/resources/a"]
     assert "https://example.org/resources/a" in index.lookup("fair data")
+
+
+def test_location_index_deduplicates_repeated_instances() -> None:
+    uri = "https://example.org/resources/repeated"
+    instance = CourseInstance(country="Canada", locality="Toronto")
+    resources = {
+        uri: TrainingResource(uri=uri, source="tess", course_instances=(instance, instance)),
+        **_sample_resources(),
+    }
+    index = LocationIndex.from_resources(resources)
+    assert index.lookup("canada") == [uri, "https://example.org/resources/a"]
+
+
+def test_tokenize_splits_ascii_and_unicode_text() -> None:
+    assert tokenize("FAIR-data, Python3!") == ["fair", "data", "python3"]
+    assert tokenize("Données FAIR") == ["donn", "es", "fair"]
+    assert tokenize("\u212aelvin İstanbul \uff26\uff35\uff2c\uff2c") == ["kelvin", "i", "stanbul"]
+    assert tokenize(None) == []
+
+
+def test_collect_keyword_tokens_is_union_of_field_tokens() -> None:
+    resource = _sample_resources()["https://example.org/resources/a"]
+    fields = (
+        resource.name,
+        resource.description,
+        *resource.keywords,
+        *resource.learning_resource_types,
+        *resource.educational_levels,
+        *resource.prerequisites,
+        *resource.teaches,
+    )
+    expected = frozenset(token for text in fields for token in tokenize(text))
+    assert collect_keyword_tokens(resource) == expected
+
+
+def test_topic_index_lists_resource_once_per_key() -> None:
+    uri = "https://example.org/resources/c"
+    resource = TrainingResource(uri=uri, source="tess", topics=frozenset({"FAIR", "http://example.org/fair"}))
+    index = TopicIndex.from_resources({uri: resource})
+    assert index.lookup("fair") == [uri]
+
+
+def test_date_index_open_ended_and_bounded_queries() -> None:
+    index = DateIndex.from_resources(_sample_resources())
+    assert index.lookup(start=datetime(2025, 2, 1, tzinfo=timezone.utc)) == ["https://example.org/resources/b"]
+    assert index.lookup(end=datetime(2025, 1, 15, tzinfo=timezone.utc)) == ["https://example.org/resources/a"]
+    assert index.lookup(end=datetime(2024, 12, 31, tzinfo=timezone.utc)) == []
+    assert index.lookup(limit=1) == ["https://example.org/resources/a"]
+    assert [schedule.resource_uri for schedule in index.schedules] == [
+        "https://example.org/resources/a",
+        "https://example.org/resources/b",
+    ]
+
+
+def test_cached_lookups_return_fresh_lists() -> None:
+    index = KeywordIndex.from_resources(_sample_resources())
+    first = index.lookup("FAIR data")
+    first.clear()
+    assert index.lookup("fair DATA") == ["https://example.org/resources/a"]
+
+
+def test_indexes_pickle_after_cached_lookups() -> None:
+    keyword_index = KeywordIndex.from_resources(_sample_resources())
+    date_index = DateIndex.from_resources(_sample_resources())
+    keyword_hits = keyword_index.lookup("FAIR data")
+    date_hits = date_index.lookup(date(2024, 1, 1))
+
+    restored_keywords = pickle.loads(pickle.dumps(keyword_index))  # noqa: S301
+    restored_dates = pickle.loads(pickle.dumps(date_index))  # noqa: S301
+    assert restored_keywords.lookup("FAIR data") == keyword_hits
+    assert restored_dates.lookup(date(2024, 1, 1)) == date_hits
+
+    cache_keys = {(id(keyword_index), "_lookup_tokens"), (id(date_index), "_lookup_range")}
+    assert cache_keys <= _LOOKUP_CACHES.keys()
+    del keyword_index, date_index
+    gc.collect()
+    assert not cache_keys & _LOOKUP_CACHES.keys(), "Caches should be dropped with their index."
+
+
+def test_index_builders_match_from_resources() -> None:
+    resources = _sample_resources()
+    builder = DateIndexBuilder()
+    for uri, resource in resources.items():
+        builder.add(uri, resource)
+    assert builder.build() == DateIndex.from_resources(resources)
+
+
+def test_fused_index_build_matches_per_index_constructors() -> None:
+    resources = _sample_resources()
+    indexes, _ = _build_indexes_and_stats(resources, {"tess": 2}, datetime.now(timezone.utc))
+    assert indexes == (
+        KeywordIndex.from_resources(resources),
+        ProviderIndex.from_resources(resources),
+        LocationIndex.from_resources(resources),
+        DateIndex.from_resources(resources),
+        TopicIndex.from_resources(resources),
+    )
+
+
+def test_date_index_returns_each_resource_once() -> None:
+    uri = "https://example.org/resources/weekly"
+    instances = tuple(
+        CourseInstance(start_date=datetime(2025, 3, day, tzinfo=timezone.utc)) for day in range(1, 29, 7)
+    )
+    index = DateIndex.from_resources({uri: TrainingResource(uri=uri, source="tess", course_instances=instances)})
+    assert index.lookup(datetime(2025, 3, 1, tzinfo=timezone.utc)) == [uri]
+
+
+def test_date_index_range_bounds_are_inclusive() -> None:
+    uri = "https://example.org/resources/edge"
+    instance = CourseInstance(
+        start_date=datetime(2025, 5, 1, tzinfo=timezone.utc),
+        end_date=datetime(2025, 5, 3, tzinfo=timezone.utc),
+    )
+    index = DateIndex.from_resources({uri: TrainingResource(uri=uri, source="tess", course_instances=(instance,))})
+    assert index.lookup(end=datetime(2025, 5, 1, tzinfo=timezone.utc)) == [uri]
+    assert index.lookup(start=datetime(2025, 5, 3, tzinfo=timezone.utc)) == [uri]
+    assert index.lookup(start=datetime(2025, 5, 3, 0, 0, 1, tzinfo=timezone.utc)) == []
+    assert index.lookup(end=datetime(2025, 4, 30, 23, 59, 59, tzinfo=timezone.utc)) == []
+
+
+def test_date_index_bisected_lookup_matches_linear_scan() -> None:
+    rng = random.Random(7)  # noqa: S311
+    origin = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    resources: dict[str, TrainingResource] = {}
+    for number in range(60):
+        uri = f"https://example.org/resources/{number}"
+        instances = []
+        for _ in range(rng.randint(1, 3)):
+            start = origin + timedelta(days=rng.randint(0, 365))
+            end = start + timedelta(days=rng.randint(0, 10)) if rng.random() < 0.7 else None
+            instances.append(CourseInstance(start_date=start, end_date=end))
+        resources[uri] = TrainingResource(uri=uri, source="tess", course_instances=tuple(instances))
+    index = DateIndex.from_resources(resources)
+
+    schedules = sorted(
+        ((instance.start_date, instance.end_date or instance.start_date, uri)
+         for uri, resource in resources.items() for instance in resource.course_instances),
+        key=lambda row: row[0],
+    )
+    days = [None, *(origin + timedelta(days=offset) for offset in range(-5, 375, 9))]
+    # Early windows take the start-bounded scan, late ones the end-sorted index.
+    for start in days:
+        for end in days:
+            expected = dict.fromkeys(
+                uri
+                for schedule_start, schedule_end, uri in schedules
+                if (end is None or schedule_start <= end) and (start is None or schedule_end >= start)
+            )
+            assert index.lookup(start, end) == list(expected)
+            assert index.lookup(start, end, limit=2) == list(expected)[:2]
+
+
+def test_normalize_datetime_input_returns_utc() -> None:
+    aware = datetime(2025, 1, 1, 12, tzinfo=timezone.utc)
+    assert normalize_datetime_input(aware) is aware
+    assert normalize_datetime_input(datetime(2025, 1, 1, 12)) == aware
+    assert normalize_datetime_input(date(2025, 1, 1)) == datetime(2025, 1, 1, tzinfo=timezone.utc)
+    assert normalize_datetime_input(None) is None
+
+
+def test_input_to_epoch_micros_matches_normalized_datetimes() -> None:
+    paris = timezone(timedelta(hours=2))
+    for value in (date(2025, 1, 1), date(1969, 12, 31), datetime(2025, 6, 1, 12), datetime(2025, 6, 1, 14, tzinfo=paris)):
+        assert input_to_epoch_micros(value) == to_epoch_micros(normalize_datetime_input(value))
+    assert input_to_epoch_micros(None) is None
+
+
+def test_lookup_iter_respects_limit() -> None:
+    index = LocationIndex.from_resources(_sample_resources())
+    assert list(index.lookup_iter("Canada", limit=1)) == ["https://example.org/resources/a"]
+    assert list(index.lookup_iter("Atlantis")) == []
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import pickle
 from pathlib import Path
 
 import pytest
-from rdflib import Graph, Namespace, URIRef
+from rdflib import BNode, Dataset, Graph, Literal, Namespace, URIRef
+from rdflib.namespace import RDF
 
 from elixir_training_mcp.data_models import TrainingResource
 from elixir_training_mcp.loader import extract_resources_from_graph
-from elixir_training_mcp.loader.dedupe import resolve_resource_identifier, select_richest
+from elixir_training_mcp.loader import graph as graph_module
+from elixir_training_mcp.loader import parser as parser_module
+from elixir_training_mcp.loader.dedupe import resolve_resource_identifier, resource_quality, select_richest
+from elixir_training_mcp.loader.utils import AdjacencyCache, TripleIndex, schema_predicates
 
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
@@ -30,6 +35,46 @@ def test_extract_resources_from_graph_parses_expected_resource(tess_graph: Graph
     assert any(instance.country == "Canada" for instance in resource.course_instances)
 
 
+def test_extracted_resources_pickle_round_trip(tess_graph: Graph) -> None:
+    resources = extract_resources_from_graph(tess_graph, "tess")
+    restored = pickle.loads(pickle.dumps(resources))  # noqa: S301
+
+    assert restored == resources
+    for uri, resource in resources.items():
+        assert not hasattr(resource, "__dict__")
+        assert restored[uri].keyword_tokens == resource.keyword_tokens
+
+
+def test_resource_subjects_lists_each_typed_subject_once() -> None:
+    http_schema = Namespace("http://schema.org/")
+    https_schema = Namespace("https://schema.org/")
+    course = URIRef("https://example.org/course")
+    event = URIRef("https://example.org/event")
+    graph = Graph()
+    graph.add((event, RDF.type, https_schema.Event))
+    graph.add((course, RDF.type, https_schema.Course))
+    graph.add((course, RDF.type, http_schema.LearningResource))
+    graph.add((URIRef("https://example.org/person"), RDF.type, https_schema.Person))
+
+    assert list(parser_module._resource_subjects(graph)) == [course, event]
+
+
+def test_equal_blank_node_providers_share_one_organization() -> None:
+    schema = Namespace("https://schema.org/")
+    graph = Graph()
+    for slug in ("first", "second"):
+        course = URIRef(f"https://example.org/{slug}")
+        provider = BNode()
+        graph.add((course, RDF.type, schema.Course))
+        graph.add((course, schema.url, course))
+        graph.add((course, schema.provider, provider))
+        graph.add((provider, schema.name, Literal("ELIXIR")))
+
+    first, second = extract_resources_from_graph(graph, "tess").values()
+    assert first.provider is not None and first.provider.name == "ELIXIR"
+    assert first.provider is second.provider
+
+
 def test_select_richest_prefers_resource_with_more_metadata() -> None:
     uri = "https://example.org/resource"
     basic = TrainingResource(uri=uri, source="tess")
@@ -41,6 +86,20 @@ def test_select_richest_prefers_resource_with_more_metadata() -> None:
     assert resources[uri] is richer
 
 
+def test_resource_quality_counts_set_fields_only() -> None:
+    uri = "https://example.org/resource"
+    assert resource_quality(TrainingResource(uri=uri, source="tess")) == 0
+    resource = TrainingResource(
+        uri=uri,
+        source="tess",
+        name="Example resource",
+        keywords=frozenset({"python"}),
+        topics=frozenset(),
+        is_accessible_for_free=False,
+    )
+    assert resource_quality(resource) == 2
+
+
 def test_resolve_resource_identifier_prefers_schema_url() -> None:
     schema = Namespace("https://schema.org/")
     subject = URIRef("https://example.org/node")
@@ -50,3 +109,71 @@ def test_resolve_resource_identifier_prefers_schema_url() -> None:
 
     identifier = resolve_resource_identifier(graph, subject)
     assert identifier == "https://canonical.example.org/resource"
+
+
+def test_adjacency_cache_matches_graph_objects(tess_graph: Graph) -> None:
+    cache = AdjacencyCache(tess_graph)
+    for subject, predicate in {(subject, predicate) for subject, predicate, _ in tess_graph}:
+        assert list(cache.objects(subject, predicate)) == list(tess_graph.objects(subject, predicate))
+    assert list(cache.objects(URIRef("https://example.org/missing"), URIRef("https://schema.org/name"))) == []
+
+
+def test_adjacency_cache_stays_within_its_named_graph() -> None:
+    schema = Namespace("https://schema.org/")
+    subject = URIRef("https://example.org/shared")
+    dataset = Dataset()
+    dataset.graph(URIRef("urn:graph:tess")).add((subject, schema.name, URIRef("urn:tess-name")))
+    gtn_graph = dataset.graph(URIRef("urn:graph:gtn"))
+    gtn_graph.add((subject, schema.name, URIRef("urn:gtn-name")))
+
+    assert list(AdjacencyCache(gtn_graph).objects(subject, schema.name)) == [URIRef("urn:gtn-name")]
+
+
+def test_triple_index_matches_graph_objects(tess_graph: Graph) -> None:
+    index = TripleIndex(tess_graph)
+    for subject, predicate in {(subject, predicate) for subject, predicate, _ in tess_graph}:
+        assert set(index.objects(subject, predicate)) == set(tess_graph.objects(subject, predicate))
+        assert set(index.edges(subject)) == set(tess_graph.predicates(subject))
+
+    # Absent subjects and predicates are plain dict misses, with no store probe.
+    missing = URIRef("https://example.org/missing")
+    assert list(index.objects(missing, URIRef("https://schema.org/name"))) == []
+    assert dict(index.edges(missing)) == {}
+    subject = next(iter(tess_graph.subjects()))
+    assert list(index.objects(subject, URIRef("https://schema.org/notAPredicate"))) == []
+
+
+@pytest.mark.parametrize("fixture_name,source_key", [("tess_sample.ttl", "tess"), ("gtn_sample.ttl", "gtn")])
+def test_oxigraph_parser_matches_rdflib(monkeypatch: pytest.MonkeyPatch, fixture_name: str, source_key: str) -> None:
+    pytest.importorskip("pyoxigraph")
+    path = FIXTURES_DIR / fixture_name
+    fast_graph, _ = graph_module.load_source_graph(Dataset(), source_key, path)
+    monkeypatch.setattr(graph_module, "pyoxigraph", None)
+    rdflib_graph, _ = graph_module.load_source_graph(Dataset(), source_key, path)
+
+    assert len(fast_graph) == len(rdflib_graph)
+    assert extract_resources_from_graph(fast_graph, source_key) == extract_resources_from_graph(rdflib_graph, source_key)
+
+
+@pytest.mark.parametrize("fixture_name,source_key", [("tess_sample.ttl", "tess"), ("gtn_sample.ttl", "gtn")])
+def test_triple_index_extraction_matches_graph(fixture_name: str, source_key: str) -> None:
+    pytest.importorskip("pyoxigraph")
+    path = FIXTURES_DIR / fixture_name
+    graph, _ = graph_module.load_source_graph(Dataset(), source_key, path)
+    from_triples = parser_module.extract_resources_from_triples(
+        graph_module.read_source_triples(source_key, path), source_key
+    )
+
+    assert from_triples == extract_resources_from_graph(graph, source_key)
+    assert list(from_triples) == list(extract_resources_from_graph(graph, source_key))
+
+
+def test_parsed_predicates_reuse_shared_uriref_instances() -> None:
+    pytest.importorskip("pyoxigraph")
+    triples = graph_module.read_source_triples("tess", FIXTURES_DIR / "tess_sample.ttl")
+    assert triples is not None
+    shared = {str(uri): uri for uri in (RDF.type, *schema_predicates("name", "description", "provider"))}
+    predicates = {predicate for _, predicate, _ in triples if str(predicate) in shared}
+
+    assert RDF.type in predicates and len(predicates) > 1
+    assert all(predicate is shared[str(predicate)] for predicate in predicates)
@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+import asyncio
+import gc
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from pathlib import Path
 
-from elixir_training_mcp import data_store
+import pytest
+
+from elixir_training_mcp import data_store, services
 from elixir_training_mcp.tools import TrainingDataService
 
 
@@ -56,3 +64,127 @@ def test_topic_search_matches_edam_topic():
     service = make_service()
     results = service.search_by_topic("topic_3391")
     assert results[0]["uri"] == "https://tess.example.org/materials/python-fair-data"
+
+
+def test_service_singleton_loads_once_under_concurrent_first_calls(monkeypatch):
+    store = make_service()._store
+    calls = []
+
+    def slow_load(*args, **kwargs):
+        calls.append(threading.get_ident())
+        time.sleep(0.05)
+        return store
+
+    monkeypatch.setattr(services, "_service_instance", None)
+    monkeypatch.setattr(services.data_store, "load_training_data", slow_load)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        instances = list(executor.map(lambda _: services.get_training_data_service(), range(4)))
+
+    assert len(calls) == 1
+    assert all(instance is instances[0] for instance in instances)
+
+
+def test_service_snapshot_cache_dir_follows_environment(monkeypatch, tmp_path):
+    store = make_service()._store
+    cache_dirs = []
+
+    def load(*args, cache_dir=None, **kwargs):
+        cache_dirs.append(cache_dir)
+        return store
+
+    monkeypatch.setattr(services.data_store, "load_training_data", load)
+    monkeypatch.delenv("ELIXIR_MCP_NO_CACHE", raising=False)
+    monkeypatch.delenv("ELIXIR_MCP_CACHE_DIR", raising=False)
+    for env in ({}, {"ELIXIR_MCP_CACHE_DIR": str(tmp_path)}, {"ELIXIR_MCP_NO_CACHE": "1"}):
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        monkeypatch.setattr(services, "_service_instance", None)
+        services.get_training_data_service()
+
+    assert cache_dirs == [services._CACHE_DIR, tmp_path, None]
+
+
+def test_server_freezes_loaded_store_only_when_asked(monkeypatch):
+    mcp_server = pytest.importorskip("elixir_training_mcp.mcp_server")
+
+    service = make_service()
+    monkeypatch.setattr(services, "_service_instance", service)
+    monkeypatch.setattr(mcp_server.mcp, "run", lambda *args, **kwargs: None)
+    tracked = lambda: any(obj is service._store for obj in gc.get_objects())  # noqa: E731
+
+    monkeypatch.setattr("sys.argv", ["elixir-training-mcp"])
+    mcp_server.cli()
+    assert tracked()
+    monkeypatch.setattr("sys.argv", ["elixir-training-mcp", "--freeze-gc"])
+    try:
+        mcp_server.cli()
+        assert not tracked(), "The loaded store should sit in the permanent generation."
+    finally:
+        gc.unfreeze()
+
+
+async def test_tess_search_shares_requests_and_bounds_its_cache(monkeypatch):
+    mcp_server = pytest.importorskip("elixir_training_mcp.mcp_server")
+    httpx = pytest.importorskip("httpx")
+
+    requested: list[str] = []
+
+    async def handler(request):
+        requested.append(request.url.params["q"])
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json=[{"title": request.url.params["q"]}])
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(mcp_server, "_tess_client", client)
+    monkeypatch.setattr(mcp_server, "_tess_cache", OrderedDict())
+    monkeypatch.setattr(mcp_server, "_tess_pending", {})
+    try:
+        first, second, third = await asyncio.gather(
+            *(mcp_server.search_training_materials("python data") for _ in range(3))
+        )
+        assert requested == ["python data"], "Concurrent identical searches should share one request."
+        assert first == second == third == [{"title": "python data"}]
+
+        first[0]["title"] = "mutated"
+        assert await mcp_server.search_training_materials("python data") == [{"title": "python data"}]
+        assert len(requested) == 1
+
+        query = "python%20data"
+        mcp_server._tess_cache[query] = (0.0, mcp_server._tess_cache[query][1])
+        await mcp_server.search_training_materials("python data")
+        assert len(requested) == 2, "Expired entries should be fetched again."
+
+        mcp_server._tess_cache.clear()
+        expiry = time.monotonic() + 60
+        for index in range(mcp_server._TESS_CACHE_SIZE):
+            mcp_server._tess_cache[f"q{index}"] = (expiry, b"[]")
+        await mcp_server.search_training_materials("fresh")
+        assert len(mcp_server._tess_cache) == mcp_server._TESS_CACHE_SIZE
+        assert "q0" not in mcp_server._tess_cache and "fresh" in mcp_server._tess_cache
+        assert not mcp_server._tess_pending
+    finally:
+        await client.aclose()
+
+
+def test_sparql_rows_match_rdflib_and_fall_back_for_lenient_queries():
+    pytest.importorskip("pyoxigraph")
+    service = make_service()
+    rdflib_rows = lambda query: sorted(  # noqa: E731
+        tuple(map(str, row)) for row in service.dataset.query(query) if not isinstance(row, bool)
+    )
+    # xsd is not declared: rdflib resolves it from the dataset's bound namespaces.
+    query = """PREFIX schema: <http://schema.org/>
+    SELECT ?course ?text ?missing WHERE {
+      ?course schema:hasCourseInstance ?instance .
+      ?instance schema:startDate ?start .
+      OPTIONAL { ?instance schema:doesNotExist ?missing }
+      BIND(xsd:string(?start) AS ?text)
+      FILTER(?text >= "2025-01-01")
+    }"""
+    assert service._store.sparql_store is not None
+    assert sorted(service.sparql_rows(query)) == rdflib_rows(query)
+    assert sorted(service.sparql_rows(query))
+
+    # Oxigraph rejects projecting an ungrouped variable; rdflib answers it.
+    lenient = "SELECT ?s ?o WHERE { ?s ?p ?o } GROUP BY ?s"
+    assert sorted(service.sparql_rows(lenient)) == rdflib_rows(lenient)